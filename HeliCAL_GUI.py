@@ -1,35 +1,160 @@
 import sys
+import struct
 import subprocess
 import threading
 import time
+from queue import Queue
 
-from PyQt5.QtCore import QTimer, Qt
+from PyQt5.QtCore import QTimer, Qt, QThread, pyqtSignal
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QTabWidget, QVBoxLayout, QPushButton,
     QFileDialog, QLabel, QHBoxLayout, QLineEdit, QTextEdit, QMessageBox
 )
 from PyQt5.QtGui import QImage, QPixmap
+import numpy as np
 import serial
 import cv2
 
+# THETA_VEL_SET payload: int32 little-endian pulses/sec after the 2-byte header
+_vel_packer = struct.Struct('<i')
+
+
+class CameraWorker(QThread):
+    """
+    Grabs camera frames off the GUI thread.
+    Frames are grabbed continuously but only decoded (retrieve) when the GUI asks for one.
+    """
+    frame_ready = pyqtSignal(np.ndarray)
+
+    def __init__(self, device=0, width=640, height=480, fps=30, parent=None):
+        super().__init__(parent)
+        # Prefer the Jetson's VIC (nvvidconv) for scaling/colour conversion; plain V4L2 otherwise
+        self.cap = cv2.VideoCapture(self._gst_pipeline(device, width, height, fps), cv2.CAP_GSTREAMER)
+        if not self.cap.isOpened():
+            self.cap.release()
+            self.cap = cv2.VideoCapture(device)
+            # Ask V4L2 for the preview size up front so nothing downstream handles full-res frames
+            self.cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*'MJPG'))
+            self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, width)
+            self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
+            self.cap.set(cv2.CAP_PROP_FPS, fps)
+            self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+        # Frames are decoded into one persistent buffer; the GUI requests the next frame only
+        # after it has copied the previous one into a pixmap, so the buffer is never shared.
+        w = int(self.cap.get(cv2.CAP_PROP_FRAME_WIDTH)) or width
+        h = int(self.cap.get(cv2.CAP_PROP_FRAME_HEIGHT)) or height
+        self._frame_buf = np.empty((h, w, 3), dtype=np.uint8)
+        self._atomic_request = threading.Event()
+        self._running = False
+
+    @staticmethod
+    def _gst_pipeline(device, width, height, fps):
+        """GStreamer capture that scales on the VIC and hands OpenCV BGR frames at preview size."""
+        return (
+            f"v4l2src device=/dev/video{device} ! "
+            f"nvvidconv ! video/x-raw,format=BGRx,width={width},height={height},framerate={fps}/1 ! "
+            "videoconvert ! video/x-raw,format=BGR ! "
+            "appsink drop=1 max-buffers=1"
+        )
+
+    def request_frame(self):
+        """Ask the capture loop to decode the next grabbed frame (called from the GUI timer)."""
+        self._atomic_request.set()
+
+    def stop(self):
+        self._running = False
+        self.wait()
+
+    def run(self):
+        self._running = True
+        try:
+            while self._running:
+                if not self.cap.grab():
+                    self.msleep(10)
+                    continue
+                if self._atomic_request.is_set():
+                    self._atomic_request.clear()
+                    ret, frame = self.cap.retrieve(self._frame_buf)
+                    if ret:
+                        self._frame_buf = frame  # OpenCV reallocates if the driver changed size
+                        self.frame_ready.emit(frame)
+                    else:
+                        self._atomic_request.set()  # retry on the next grab
+        finally:
+            self.cap.release()
+
+
+class SerialWorker(QThread):
+    """
+    Owns the ESP32 serial port so writes and ACK reads never block the GUI thread.
+    The GUI enqueues complete command frames; each is written and answered by a 1-byte ACK.
+    """
+    ack_received = pyqtSignal(bytes)
+    error = pyqtSignal(str)
+
+    def __init__(self, port, baudrate=115200, timeout=0.2, parent=None):
+        super().__init__(parent)
+        self.port = serial.Serial(port, baudrate, timeout=timeout)
+        self._queue = Queue()
+
+    def enqueue(self, cmd):
+        """Queue a command frame; a copy is taken so callers may reuse their buffer."""
+        self._queue.put(bytes(cmd))
+
+    def stop(self):
+        self._queue.put(None)
+        self.wait()
+
+    def _send(self, cmd):
+        """Write one frame and return the firmware's 1-byte ACK (b'' on timeout)."""
+        self.port.write(cmd)
+        self.port.flush()
+        return self.port.read(1)
+
+    def run(self):
+        try:
+            while True:
+                cmd = self._queue.get()
+                if cmd is None:
+                    break
+                try:
+                    ack = self._send(cmd)
+                    if ack != b'\x01':
+                        # Out of sync (stale bytes or a lost ACK): flush once and resend
+                        self.port.reset_input_buffer()
+                        ack = self._send(cmd)
+                    self.ack_received.emit(ack)
+                except Exception as e:
+                    self.error.emit(str(e))
+        finally:
+            self.port.close()
+
+
 class HeliCALGui(QMainWindow):
     """
     Main GUI for the HeliCAL Control Panel.
     """
+    process_output = pyqtSignal(str)
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("HeliCAL Control Panel")
         self.resize(800, 600)
 
         # Placeholders for serial & camera
-        self.serial_port = None
-        self.camera = None
+        self.serial_worker = None
+        self.camera_worker = None
+        self._last_frame = None
+        self._qimg = None
+        self._camera_fit = None  # (label size, letterboxed frame size) for the current layout
+        self._frame_pending = False
+        self._proc = None
+        self._vel_buf = bytearray(b'\x30\x01\x00\x00\x00\x00')
 
         # Runtime-configurable counts per theta revolution (default from system inference)
         self.counts_per_theta_rev = 245426  # editable in UI
 
         self.tabs = QTabWidget()
-        self.setCentralWidget(self.tabs)
 
         self._build_calibration_tab()
         self._build_rotation_tab()
@@ -37,6 +162,21 @@ class HeliCALGui(QMainWindow):
         self._build_balance_tab()
         self._build_camera_tab()
 
+        # Shared output panel for the C++ helpers launched from the tabs
+        self.log_output = QTextEdit()
+        self.log_output.setReadOnly(True)
+        self.process_output.connect(self.log_output.append)
+        btn_stop_proc = QPushButton("Stop Running Program")
+        btn_stop_proc.clicked.connect(self.stop_process)
+
+        central = QWidget()
+        main_layout = QVBoxLayout()
+        main_layout.addWidget(self.tabs)
+        main_layout.addWidget(self.log_output)
+        main_layout.addWidget(btn_stop_proc)
+        central.setLayout(main_layout)
+        self.setCentralWidget(central)
+
     # ---------------- Tabs ----------------
     def _build_calibration_tab(self):
         tab = QWidget()
@@ -66,6 +206,7 @@ class HeliCALGui(QMainWindow):
         # Counts-per-rev row (editable)
         hbox2 = QHBoxLayout()
         self.cpr_input = QLineEdit(str(self.counts_per_theta_rev))
+        self.cpr_input.editingFinished.connect(self._refresh_cpr)
         hbox2.addWidget(QLabel("Counts per θ-rev:"))
         hbox2.addWidget(self.cpr_input)
         layout.addLayout(hbox2)
@@ -115,6 +256,8 @@ class HeliCALGui(QMainWindow):
 
         self.lbl_camera = QLabel()
         self.lbl_camera.setAlignment(Qt.AlignCenter)
+        # Frames are letterboxed to the label; the minimum size lets the tab shrink below the frame size
+        self.lbl_camera.setMinimumSize(1, 1)
         layout.addWidget(self.lbl_camera)
         btn_open_cam = QPushButton("Open Camera")
         btn_open_cam.clicked.connect(self.open_camera)
@@ -124,32 +267,76 @@ class HeliCALGui(QMainWindow):
         self.tabs.addTab(tab, "Camera")
 
         self.timer = QTimer()
-        self.timer.timeout.connect(self.update_frame)
+        self.timer.timeout.connect(self._request_frame)
 
     # ---------------- Helpers ----------------
+    def _spawn(self, cmd):
+        """
+        Launch a helper program and stream its combined stdout/stderr into the log panel.
+        Only one program runs at a time; Stop terminates it.
+        """
+        if self._proc and self._proc.poll() is None:
+            QMessageBox.warning(self, "Process", "Another program is still running. Stop it first.")
+            return
+        try:
+            self._proc = subprocess.Popen(
+                cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, bufsize=1, text=True
+            )
+        except OSError as e:
+            QMessageBox.critical(self, "Process", f"Failed to start {cmd[0]}: {e}")
+            return
+        self.process_output.emit(f"$ {' '.join(cmd)}")
+        threading.Thread(target=self._read_process_output, args=(self._proc,), daemon=True).start()
+
+    def _read_process_output(self, proc):
+        for line in proc.stdout:
+            self.process_output.emit(line.rstrip())
+        proc.stdout.close()
+        self.process_output.emit(f"[exit {proc.wait()}]")
+
+    def stop_process(self):
+        if self._proc and self._proc.poll() is None:
+            self._proc.terminate()
+
     def run_calibration(self):
-        threading.Thread(target=lambda: subprocess.run(['./cal6_calibrate'], check=True)).start()
+        self._spawn(['./cal6_calibrate'])
 
     def connect_esp32(self):
         port = self.port_input.text().strip()
+        if self.serial_worker:
+            self.serial_worker.stop()
+            self.serial_worker = None
         try:
-            self.serial_port = serial.Serial(port, 115200, timeout=0.2)
-            QMessageBox.information(self, "ESP32", f"Connected to {port}")
+            worker = SerialWorker(port, 115200, timeout=0.2)
         except Exception as e:
             QMessageBox.critical(self, "ESP32", f"Failed to open {port}: {e}")
+            return
+        worker.ack_received.connect(self._on_serial_ack)
+        worker.error.connect(self._on_serial_error)
+        self.serial_worker = worker
+        worker.start()
+        QMessageBox.information(self, "ESP32", f"Connected to {port}")
 
-    def rpm_to_pulses_per_sec(self, rpm: float) -> int:
-        """
-        Convert rpm on the theta axis to encoder pulses/sec using counts_per_theta_rev.
-        pulses/sec = rpm * counts_per_theta_rev / 60
-        """
+    def _on_serial_ack(self, ack):
+        if ack != b'\x01':
+            self.process_output.emit(f"[UART] Unexpected ACK: {ack!r}")
+
+    def _on_serial_error(self, message):
+        QMessageBox.critical(self, "UART", f"Failed to send velocity: {message}")
+
+    def _refresh_cpr(self):
+        """Parse the counts-per-rev field once when the user finishes editing it."""
         try:
-            # Refresh from UI (allows live edits)
             self.counts_per_theta_rev = int(float(self.cpr_input.text().strip()))
-        except Exception:
+        except (ValueError, OverflowError):
             self.counts_per_theta_rev = 245426
             self.cpr_input.setText(str(self.counts_per_theta_rev))
 
+    def rpm_to_pulses_per_sec(self, rpm: float) -> int:
+        """
+        Convert rpm on the theta axis to encoder pulses/sec using counts_per_theta_rev.
+        pulses/sec = rpm * counts_per_theta_rev / 60
+        """
         return int(round((rpm * self.counts_per_theta_rev) / 60.0))
 
     # ---- NEW: velocity command using 0x30/0x01 (THETA_VEL_SET) ----
@@ -158,27 +345,23 @@ class HeliCALGui(QMainWindow):
         Sends a closed-loop velocity command to firmware:
           [0x30, 0x01, <int32_le pulses/sec>]
         """
-        if not self.serial_port:
+        if not self.serial_worker:
             QMessageBox.warning(self, "ESP32", "Connect to ESP32 first.")
             return
 
         # Convert rpm -> pulses/sec
         pps = self.rpm_to_pulses_per_sec(rpm)
 
-        # Build command (6 bytes total)
-        cmd = bytearray([0x30, 0x01]) + int(pps).to_bytes(4, 'little', signed=True)
-
+        # Fill the preallocated 6-byte command in place; the worker writes it and reads the ACK
         try:
-            # Optional: clear any stale bytes then send
-            self.serial_port.reset_input_buffer()
-            self.serial_port.write(cmd)
-            self.serial_port.flush()
-
-            # Optional: read 1-byte ACK (firmware writes back a single 0x01)
-            ack = self.serial_port.read(1)
-            # You can log/ignore ack; not fatal if missing due to timing
-        except Exception as e:
-            QMessageBox.critical(self, "UART", f"Failed to send velocity: {e}")
+            _vel_packer.pack_into(self._vel_buf, 2, pps)
+        except struct.error:
+            QMessageBox.warning(
+                self, "ESP32",
+                f"Velocity of {pps} pulses/sec does not fit the firmware's int32 field; check RPM and counts per rev."
+            )
+            return
+        self.serial_worker.enqueue(self._vel_buf)
 
     # ---------------- Print / Balance / Camera ----------------
     def select_video(self):
@@ -195,29 +378,57 @@ class HeliCALGui(QMainWindow):
             './cal6_print_z_translation_multi_pass', video, 'output.mp4',
             '--crop_height_px', '800', '--cycles_per_pass', '1', '--deg_per_sec', '9'
         ]
-        threading.Thread(target=lambda: subprocess.run(cmd, check=True)).start()
+        self._spawn(cmd)
 
     def run_balancing(self):
-        threading.Thread(target=lambda: subprocess.run(['./cal6_balance'], check=True)).start()
+        self._spawn(['./cal6_balance'])
 
     def open_camera(self):
-        self.camera = cv2.VideoCapture(0)
-        if not self.camera.isOpened():
+        if self.camera_worker and self.camera_worker.isRunning():
+            return
+        worker = CameraWorker(0)
+        if not worker.cap.isOpened():
+            worker.cap.release()
             QMessageBox.critical(self, "Camera", "Failed to open camera.")
             return
+        worker.frame_ready.connect(self._on_frame)
+        self.camera_worker = worker
+        self._frame_pending = False
+        worker.start()
         self.timer.start(30)
 
-    def update_frame(self):
-        ret, frame = self.camera.read()
-        if not ret:
-            return
-        frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        h, w, ch = frame.shape
-        bytes_per_line = ch * w
-        img = QImage(frame.data, w, h, bytes_per_line, QImage.Format_RGB888)
-        self.lbl_camera.setPixmap(QPixmap.fromImage(img).scaled(
-            self.lbl_camera.size(), Qt.KeepAspectRatio
+    def _request_frame(self):
+        # Skip while a frame is still in flight so the worker never overwrites a buffer in use
+        if self.camera_worker and not self._frame_pending:
+            self._frame_pending = True
+            self.camera_worker.request_frame()
+
+    def _on_frame(self, frame):
+        # The worker reuses one buffer, so the QImage wrapping it only changes if the buffer does
+        if frame is not self._last_frame:
+            self._last_frame = frame
+            h, w, ch = frame.shape
+            self._qimg = QImage(frame.data, w, h, ch * w, QImage.Format_BGR888)
+            self._camera_fit = None
+        # The aspect-preserving target size only changes when the label (or frame) is resized
+        label_size = self.lbl_camera.size()
+        if self._camera_fit is None or self._camera_fit[0] != label_size:
+            self._camera_fit = (label_size, self._qimg.size().scaled(label_size, Qt.KeepAspectRatio))
+        self.lbl_camera.setPixmap(QPixmap.fromImage(
+            self._qimg.scaled(self._camera_fit[1], Qt.IgnoreAspectRatio, Qt.FastTransformation)
         ))
+        self._frame_pending = False
+
+    def closeEvent(self, event):
+        self.timer.stop()
+        self.stop_process()
+        if self.serial_worker:
+            self.serial_worker.stop()
+            self.serial_worker = None
+        if self.camera_worker:
+            self.camera_worker.stop()
+            self.camera_worker = None
+        super().closeEvent(event)
 
 if __name__ == '__main__':
     app = QApplication(sys.argv)
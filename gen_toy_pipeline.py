@@ -14,9 +14,20 @@ Purpose:
 This version is robust against missing submodules (e.g., displaygrayscale, medium, or tigre).
 """
 
+import functools
 import os
+import re
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
 import numpy as np
 
+# VAM_HEADLESS=1 renders every figure to PNG with the Agg backend instead of opening windows
+HEADLESS = bool(os.environ.get("VAM_HEADLESS"))
+if HEADLESS:
+    import matplotlib
+
+    matplotlib.use("Agg")
+
 # Visualization fallback
 try:
     import vamtoolbox.displaygrayscale as dgr  # preferred if present
@@ -29,11 +40,10 @@ except ImportError:
         dgr = None
         DISPLAY_NAME = None
 
-import matplotlib.pyplot as plt  # fallback visualization
-
 # Core VAMToolbox imports
 import vamtoolbox as vam
 import vamtoolbox.projector as projector_module  # for exploration
+from vamtoolbox.projector import Projector3DParallel  # fallback projector
 from vamtoolbox.geometry import (
     TargetGeometry,
     ProjectionGeometry,
@@ -42,7 +52,6 @@ from vamtoolbox.geometry import (
     Volume,
     rebinFanBeam,
 )
-from vamtoolbox.util.thresholding import threshold as apply_threshold
 
 # Medium / material modeling may not be installed in all environments
 try:
@@ -53,25 +62,302 @@ except ImportError:
     AttenuationModel = None
     HAS_MEDIUM = False
 
-# Try to import tigre3D wrapper and ensure its dependency 'tigre' is present
-TIGRE_AVAILABLE = False
-try:
-    from vamtoolbox.projector.tigre3D import tigre3D
 
-    # Check if underlying 'tigre' module is importable (wrapper often depends on it)
+# Heavy optional backends are imported on first use and cached, so headless/compute-only runs
+# never pay for matplotlib, and TIGRE/ASTRA are only probed once a projection is requested.
+@functools.lru_cache(maxsize=None)
+def _pyplot():
+    """matplotlib.pyplot for the fallback viewers."""
+    import matplotlib.pyplot as plt
+
+    return plt
+
+
+@functools.lru_cache(maxsize=None)
+def _tigre():
+    """The tigre module (runs Ax/Atb on the GPU), or None when it is not installed."""
     try:
         import tigre  # type: ignore[attr-defined]
-        TIGRE_AVAILABLE = True
     except ImportError:
-        print("[Info] Underlying 'tigre' library is not installed; disabling tigre3D fallback.")
-        TIGRE_AVAILABLE = False
+        print("[Info] 'tigre' library is not installed; disabling cone-beam GPU projection.")
+        return None
+    return tigre
+
+
+@functools.lru_cache(maxsize=None)
+def _astra_cuda():
+    """Whether ASTRA has a usable CUDA device (its 3D parallel projector only has CUDA kernels)."""
+    try:
+        import astra  # type: ignore
+
+        return bool(astra.use_cuda())
+    except Exception:
+        return False
+
+
+# Numba is optional; without it the NumPy expressions below are used unchanged
+try:
+    import numba as nb
+    HAS_NUMBA = True
 except ImportError:
-    TIGRE_AVAILABLE = False
+    nb = None
+    HAS_NUMBA = False
+
+
+# ---------------------- Buffers ---------------------- #
+VOXEL_ALIGN = 64  # bytes; one cache line / AVX-512 vector
+
+
+def empty_aligned(shape, dtype=np.float32, align=VOXEL_ALIGN):
+    """np.empty whose data pointer is `align`-byte aligned (C order), for SIMD-friendly volumes."""
+    dtype = np.dtype(dtype)
+    nbytes = int(np.prod(shape)) * dtype.itemsize
+    raw = np.empty(nbytes + align, dtype=np.uint8)
+    offset = (-raw.ctypes.data) % align
+    return raw[offset:offset + nbytes].view(dtype).reshape(shape)
+
+
+def as_aligned_float32(array):
+    """Return `array` as an aligned, C-contiguous float32 buffer, copying only when needed."""
+    array = np.asarray(array)
+    if (
+        array.dtype == np.float32
+        and array.flags.c_contiguous
+        and array.ctypes.data % VOXEL_ALIGN == 0
+    ):
+        return array
+    out = empty_aligned(array.shape, np.float32)
+    out[...] = array
+    return out
+
+
+# ---------------------- Fused voxel kernels ---------------------- #
+if HAS_NUMBA:
+    @nb.njit(parallel=True, fastmath=True, cache=True)
+    def sphere_fill(out, x, r2):
+        """out[i,j,k] = 1 inside the sphere x_i^2 + x_j^2 + x_k^2 <= r2, else 0 (single pass)."""
+        n = x.shape[0]
+        for i in nb.prange(n):
+            xi2 = x[i] * x[i]
+            for j in range(n):
+                xy2 = xi2 + x[j] * x[j]
+                for k in range(n):
+                    out[i, j, k] = 1 if xy2 + x[k] * x[k] <= r2 else 0
+
+    @nb.njit(parallel=True, fastmath=True, cache=True)
+    def cube_fill(out, x, half):
+        """out[i,j,k] = 1 inside the axis-aligned cube max(|x_i|,|x_j|,|x_k|) <= half, else 0."""
+        n = x.shape[0]
+        for i in nb.prange(n):
+            ai = abs(x[i])
+            for j in range(n):
+                aij = max(ai, abs(x[j]))
+                for k in range(n):
+                    out[i, j, k] = 1 if max(aij, abs(x[k])) <= half else 0
+
+    @nb.njit(parallel=True, fastmath=True, cache=True)
+    def resin_kernel(dose, out, inv_D0):
+        """out = 1 - exp(-dose / D0) over flat buffers, fused into one streaming loop."""
+        for i in nb.prange(dose.shape[0]):
+            out[i] = 1.0 - np.exp(-dose[i] * inv_D0)
+
+    # The projector bodies take their extents as arguments and are inlined at the Numba-IR level,
+    # so a wrapper that passes compile-time constants gets fixed loop bounds and folded offsets.
+    @nb.njit(inline="always", fastmath=True)
+    def _forward_body(vol, sin_a, cos_a, sino, nx, ny, nz, n_det, n_angles):
+        cx = 0.5 * (nx - 1)
+        cy = 0.5 * (ny - 1)
+        cd = 0.5 * (n_det - 1)
+        for a in nb.prange(n_angles):
+            c = cos_a[a]
+            s = sin_a[a]
+            for i in range(nx):
+                xc = (i - cx) * c + cd
+                for j in range(ny):
+                    t = xc + (j - cy) * s
+                    r0 = int(np.floor(t))
+                    if r0 < -1 or r0 >= n_det:
+                        continue
+                    w1 = t - r0
+                    w0 = 1.0 - w1
+                    for k in range(nz):
+                        v = vol[i, j, k]
+                        if r0 >= 0:
+                            sino[r0, a, k] += w0 * v
+                        if r0 + 1 < n_det:
+                            sino[r0 + 1, a, k] += w1 * v
+
+    @nb.njit(inline="always", fastmath=True)
+    def _backward_body(sino, sin_a, cos_a, vol, nx, ny, nz, n_det, n_angles):
+        cx = 0.5 * (nx - 1)
+        cy = 0.5 * (ny - 1)
+        cd = 0.5 * (n_det - 1)
+        for i in nb.prange(nx):
+            for a in range(n_angles):
+                c = cos_a[a]
+                s = sin_a[a]
+                xc = (i - cx) * c + cd
+                for j in range(ny):
+                    t = xc + (j - cy) * s
+                    r0 = int(np.floor(t))
+                    if r0 < -1 or r0 >= n_det:
+                        continue
+                    w1 = t - r0
+                    w0 = 1.0 - w1
+                    for k in range(nz):
+                        acc = 0.0
+                        if r0 >= 0:
+                            acc += w0 * sino[r0, a, k]
+                        if r0 + 1 < n_det:
+                            acc += w1 * sino[r0 + 1, a, k]
+                        vol[i, j, k] += acc
+
+    @nb.njit(parallel=True, fastmath=True, cache=True)
+    def parallel_forward(vol, sin_a, cos_a, sino):
+        """Voxel-driven parallel-beam projection about z for every angle in one launch.
+
+        vol is (nX, nY, nZ); sino is a zeroed (nR, nAngles, nZ) buffer. Each angle owns its own
+        sinogram column, so the prange over angles never races.
+        """
+        nx, ny, nz = vol.shape
+        _forward_body(vol, sin_a, cos_a, sino, nx, ny, nz, sino.shape[0], sin_a.shape[0])
+
+    @nb.njit(parallel=True, fastmath=True, cache=True)
+    def parallel_backward(sino, sin_a, cos_a, vol):
+        """Adjoint of parallel_forward: smear every angle back into a zeroed (nX, nY, nZ) volume."""
+        nx, ny, nz = vol.shape
+        _backward_body(sino, sin_a, cos_a, vol, nx, ny, nz, sino.shape[0], sin_a.shape[0])
+
+
+# (n, n_angles) combinations the pipeline actually runs; these get shape-specialized projector kernels
+SPECIALIZED_PROJECTOR_SHAPES = {(64, 90), (128, 90)}
+
+
+@functools.lru_cache(maxsize=None)
+def specialized_projector_kernels(n, n_angles):
+    """(forward, backward) for an n^3 volume and n_angles views with every extent a compile-time constant.
+
+    Numba freezes closure variables, so the inlined loop bounds and centre offsets are constant-folded.
+    Compiled on first use per process (closures are not disk-cached).
+    """
+    @nb.njit(parallel=True, fastmath=True)
+    def forward(vol, sin_a, cos_a, sino):
+        _forward_body(vol, sin_a, cos_a, sino, n, n, n, n, n_angles)
+
+    @nb.njit(parallel=True, fastmath=True)
+    def backward(sino, sin_a, cos_a, vol):
+        _backward_body(sino, sin_a, cos_a, vol, n, n, n, n, n_angles)
+
+    return forward, backward
+
+
+class NumbaParallelProjector:
+    """CPU parallel-beam projector that batches all angles into one Numba call (used without ASTRA-CUDA)."""
+
+    def __init__(self, shape, sin_a, cos_a):
+        self.shape = tuple(shape)
+        self.sin_a = np.ascontiguousarray(sin_a, dtype=np.float32)
+        self.cos_a = np.ascontiguousarray(cos_a, dtype=np.float32)
+        n = self.shape[0]
+        if self.shape == (n, n, n) and (n, self.sin_a.size) in SPECIALIZED_PROJECTOR_SHAPES:
+            self._forward, self._backward = specialized_projector_kernels(n, self.sin_a.size)
+        else:
+            self._forward, self._backward = parallel_forward, parallel_backward
 
-from vamtoolbox.projector import Projector3DParallel  # fallback projector
+    def forward(self, array):
+        sino = np.zeros((self.shape[0], self.sin_a.size, self.shape[2]), dtype=np.float32)
+        self._forward(as_aligned_float32(array), self.sin_a, self.cos_a, sino)
+        return sino
+
+    def backward(self, sino):
+        vol = np.zeros(self.shape, dtype=np.float32)
+        self._backward(as_aligned_float32(sino), self.sin_a, self.cos_a, vol)
+        return vol
 
 
 # ---------------------- Visualization helpers ---------------------- #
+_ARRAY_WRAPPERS = (Volume, Sinogram, Reconstruction, TargetGeometry)
+
+
+def _as_array(x):
+    """Unwrap a vamtoolbox Volume/Sinogram/Reconstruction to its ndarray; pass arrays through."""
+    return x.array if isinstance(x, _ARRAY_WRAPPERS) else x
+
+
+@functools.lru_cache(maxsize=None)
+def fan_rebinner(vial_width, N_screen=(128, 128), n_write=1.0, throw_ratio=1.0):
+    """rebinFanBeam with the screen geometry bound once per configuration.
+
+    rebinFanBeam has no `out=` argument, so the returned callable copies its result into a
+    reused aligned float32 buffer (one per sinogram shape) that the projectors consume directly.
+    The buffer is overwritten on the next call with the same shape.
+    """
+    rebin = functools.partial(
+        rebinFanBeam, vial_width=vial_width, N_screen=N_screen, n_write=n_write, throw_ratio=throw_ratio
+    )
+    buffers = {}
+
+    def run(sino_obj):
+        fan = rebin(sino_obj)
+        fan_array = np.asarray(_as_array(fan))
+        out = buffers.get(fan_array.shape)
+        if out is None:
+            out = buffers[fan_array.shape] = empty_aligned(fan_array.shape, np.float32)
+        np.copyto(out, fan_array, casting="unsafe")
+        return out
+
+    return run
+
+
+@functools.lru_cache(maxsize=None)
+def _png_writer():
+    """Background threads that render/encode headless PNGs while the next projection runs."""
+    return ThreadPoolExecutor(max_workers=2, thread_name_prefix="png")
+
+
+def _write_png(img, title):
+    # Object-oriented Figure (no pyplot global state), so rendering is safe off the main thread
+    from matplotlib.figure import Figure
+
+    fig = Figure()
+    ax = fig.add_subplot()
+    ax.imshow(img, cmap="gray", origin="lower")
+    ax.set_title(title)
+    ax.axis("off")
+    fig.tight_layout()
+    fig.savefig(re.sub(r"[^\w.-]+", "_", title) + ".png", dpi=80)
+
+
+def save_png_async(img, title):
+    """Queue `img` to be written as `<title>.png`; returns the Future."""
+    return _png_writer().submit(_write_png, img, title)
+
+
+# Figure/axes/image reused by the interactive fallback viewers while the window stays open
+_FIG = None
+_AX = None
+_IM = None
+
+
+def _show_image(img, title):
+    global _FIG, _AX, _IM
+    plt = _pyplot()
+    if _IM is not None and plt.fignum_exists(_FIG.number) and _IM.get_array().shape == img.shape:
+        _IM.set_data(img)
+        _IM.set_clim(float(np.min(img)), float(np.max(img)))
+        _AX.set_title(title)
+    else:
+        _FIG, _AX = plt.subplots()
+        _IM = _AX.imshow(img, cmap="gray", origin="lower")
+        _AX.set_title(title)
+        _AX.axis("off")
+        _FIG.tight_layout()
+    _FIG.canvas.draw_idle()
+    # Non-blocking so the next view can update this window in place; pause lets the GUI repaint
+    plt.show(block=False)
+    plt.pause(0.001)
+
+
 def fallback_show_volume(volume_array, title="Volume"):
     """Show a central slice of a 3D volume using matplotlib as fallback."""
     if volume_array.ndim == 3:
@@ -81,12 +367,10 @@ def fallback_show_volume(volume_array, title="Volume"):
         img = volume_array
     else:
         img = np.take(volume_array, volume_array.shape[-1] // 2, axis=-1)
-    plt.figure()
-    plt.imshow(img, cmap="gray", origin="lower")
-    plt.title(title + " (central slice)")
-    plt.axis("off")
-    plt.tight_layout()
-    plt.show()
+    if HEADLESS:
+        save_png_async(img, title + " (central slice)")
+        return
+    _show_image(img, title + " (central slice)")
 
 
 def fallback_show_sinogram(sino_array, title="Sinogram"):
@@ -98,17 +382,15 @@ def fallback_show_sinogram(sino_array, title="Sinogram"):
         img = sino_array
     else:
         img = np.squeeze(sino_array)
-    plt.figure()
-    plt.imshow(img, cmap="gray", origin="lower")
-    plt.title(title)
-    plt.axis("off")
-    plt.tight_layout()
-    plt.show()
+    if HEADLESS:
+        save_png_async(img, title)
+        return
+    _show_image(img, title)
 
 
 def show_volume(title, array):
     """Unified caller for showing a volume whether display module exists or not."""
-    if dgr:
+    if dgr and not HEADLESS:
         if hasattr(dgr, "showVolumeSlicer"):
             try:
                 dgr.showVolumeSlicer(array, vol_type="z", title=title)
@@ -126,7 +408,7 @@ def show_volume(title, array):
 
 def show_sinogram(title, sino_array):
     """Unified caller for showing a sinogram whether display module exists or not."""
-    if dgr:
+    if dgr and not HEADLESS:
         if hasattr(dgr, "showSinoSlicer"):
             try:
                 dgr.showSinoSlicer(sino_array, title=title)
@@ -166,19 +448,29 @@ def explore_modules():
 
 def make_synthetic_object(shape: str, resolution: int = 64):
     """Generate a synthetic 3D object (sphere or cube) as a voxel volume, patched to work with ASTRA projector."""
-    x = np.linspace(-1, 1, resolution)
-    X, Y, Z = np.meshgrid(x, x, x, indexing="ij")
-
+    # Broadcast three 1-D float32 axes instead of materializing full meshgrid volumes
+    x = np.linspace(-1, 1, resolution, dtype=np.float32)
+    xx = x.reshape(-1, 1, 1)
+    yy = x.reshape(1, -1, 1)
+    zz = x.reshape(1, 1, -1)
+
+    # Occupancy is stored as a 1-byte mask; projectors get float32 via as_aligned_float32
+    binary = empty_aligned((resolution,) * 3, np.uint8)
     if shape.lower() == "sphere":
-        radius = 0.5
-        binary = ((X ** 2 + Y ** 2 + Z ** 2) <= radius ** 2).astype(np.float32)
+        radius = np.float32(0.5)
+        if HAS_NUMBA:
+            sphere_fill(binary, x, radius * radius)
+        else:
+            np.less_equal(xx * xx + yy * yy + zz * zz, radius * radius, out=binary)
     elif shape.lower() == "cube":
-        half = 0.5
-        binary = (
-            (np.abs(X) <= half)
-            & (np.abs(Y) <= half)
-            & (np.abs(Z) <= half)
-        ).astype(np.float32)
+        half = np.float32(0.5)
+        if HAS_NUMBA:
+            cube_fill(binary, x, half)
+        else:
+            # Chebyshev distance from broadcast 1-D |axes|: one N^3 temporary plus the output
+            ax = np.abs(x)
+            dist = np.maximum(np.maximum(ax.reshape(-1, 1, 1), ax.reshape(1, -1, 1)), ax.reshape(1, 1, -1))
+            np.less_equal(dist, half, out=binary)
     else:
         raise ValueError(f"Unknown shape '{shape}'")
 
@@ -190,12 +482,51 @@ def make_synthetic_object(shape: str, resolution: int = 64):
     return vol
 
 
-def load_external_mesh(path: str, resolution: int = 64):
-    """Load and voxelize an external mesh file (.stl or .obj)."""
+def _voxelize_with_trimesh(path: str, resolution: int):
+    """Voxelize with trimesh's vectorized subdivision + fill instead of VAMToolbox's per-slice walk."""
+    try:
+        import trimesh
+    except ImportError:
+        raise RuntimeError("backend='trimesh' needs 'trimesh' installed (pip install trimesh)")
+
+    mesh = trimesh.load(path, force="mesh")
+    pitch = float(mesh.extents.max()) / (resolution - 1)
+    grid = mesh.voxelized(pitch).fill().matrix
+
+    # Centre the occupancy grid in a resolution^3 cube (trimesh may return one extra layer per axis)
+    binary = empty_aligned((resolution,) * 3, np.uint8)
+    binary.fill(0)
+    src, dst = [], []
+    for size in grid.shape:
+        n = min(size, resolution)
+        s0 = (size - n) // 2
+        d0 = (resolution - n) // 2
+        src.append(slice(s0, s0 + n))
+        dst.append(slice(d0, d0 + n))
+    binary[tuple(dst)] = grid[tuple(src)]
+
+    vol = Volume(binary, proj_geo=None)
+    vol.nX, vol.nY, vol.nZ = binary.shape
+    vol.array = binary
+    vol.voxels = binary
+    return vol
+
+
+def load_external_mesh(path: str, resolution: int = 64, backend: str = "vam"):
+    """Load and voxelize an external mesh file (.stl or .obj).
+
+    backend="vam" uses TargetGeometry (the reference voxelizer); backend="trimesh" is much faster
+    on large meshes and also reads .obj directly without the temporary STL round trip.
+    """
     ext = os.path.splitext(path)[1].lower()
     if ext not in [".stl", ".obj"]:
         raise ValueError("Only .stl or .obj supported")
 
+    if backend == "trimesh":
+        return _voxelize_with_trimesh(path, resolution)
+    if backend != "vam":
+        raise ValueError(f"Unknown voxelization backend '{backend}'")
+
     if ext == ".obj":
         try:
             import trimesh
@@ -213,47 +544,66 @@ def load_external_mesh(path: str, resolution: int = 64):
     return target_geo
 
 
-def simulate_cone_beam_projection(target_vol: Volume, n_angles=120):
-    """Simulate cone-beam-like projections and reconstruction."""
-    angles = np.linspace(0, 360, n_angles, endpoint=False)
-    proj_geo = ProjectionGeometry(angles, ray_type="parallel")
+def simulate_cone_beam_projection(target_vol: Volume, n_angles=120, full_sinogram=False):
+    """Simulate cone-beam-like projections and reconstruction.
 
-    # Extract the raw array for backends that expect numpy arrays
-    target_array = target_vol.array if hasattr(target_vol, "array") else target_vol
-
-    if TIGRE_AVAILABLE:
-        print("Using tigre3D for cone-beam-style projection.")
-        params = {
-            "angles": np.deg2rad(angles),
-            # Real geometry params should be populated here per tigre3D spec
-        }
+    On the TIGRE path only the central detector row of the projections is kept for display
+    unless `full_sinogram` is set; the reconstruction is unaffected.
+    On the Numba path the fan rebin is skipped and the parallel-beam sinogram is backprojected
+    as-is, so that reconstruction is an unrebinned parallel-beam backprojection.
+    """
+    angles = np.linspace(0, 360, n_angles, endpoint=False, dtype=np.float32)
+    proj_geo = ProjectionGeometry(angles, ray_type="parallel")
+    # Trig tables are computed once per run; the projector kernels only index into them
+    angles_rad = np.deg2rad(angles)
+    sin_a = np.sin(angles_rad)
+    cos_a = np.cos(angles_rad)
+
+    # Extract the raw array for backends that expect numpy arrays (one aligned C-contiguous float32 buffer)
+    target_array = as_aligned_float32(_as_array(target_vol))
+    assert target_array.dtype == np.float32, target_array.dtype
+
+    tigre = _tigre()
+    if tigre is not None:
+        print("Using TIGRE (CUDA) for cone-beam projection.")
         try:
-            # tigre3D wants the raw volume array, not the wrapped Volume object
-            cone = tigre3D(target_array, params)
-            projections = cone.forwardProject(target_array)
-            recon_array = cone.backProject(projections)
+            # Default cone geometry sized to the volume fills DSD/DSO/nDetector/dDetector/nVoxel/dVoxel
+            geo = tigre.geometry(mode="cone", nVoxel=np.array(target_array.shape), default=True)
+            projections = tigre.Ax(target_array, geo, angles_rad, "interpolated")
+            recon_array = tigre.Atb(projections, geo, angles_rad, "FDK").astype(np.float32, copy=False)
+            if not full_sinogram:
+                # (angles, v, u): keep one central row so the full stack can be freed right away
+                mid = projections.shape[1] // 2
+                projections = np.ascontiguousarray(projections[:, mid:mid + 1, :])
             sinogram_obj = Volume(projections, proj_geo)
             recon_obj = Volume(recon_array, proj_geo)
             dose_volume = recon_array
             return dose_volume, sinogram_obj, recon_obj
         except Exception as e:
-            print(f"[Warning] tigre3D failed ({e}); falling back.")
+            print(f"[Warning] TIGRE failed ({e}); falling back.")
 
     print("Using parallel-beam projection fallback.")
-    if hasattr(Projector3DParallel, "Projector3DParallelAstra"):
+    if _astra_cuda() and hasattr(Projector3DParallel, "Projector3DParallelAstra"):
+        print("  -> ASTRA CUDA projector")
         projector = Projector3DParallel.Projector3DParallelAstra(target_geo=target_vol, proj_geo=proj_geo)
+    elif HAS_NUMBA:
+        print("  -> Numba CPU projector (all angles per launch)")
+        projector = NumbaParallelProjector(target_array.shape, sin_a, cos_a)
     else:
         projector = Projector3DParallel.Projector3DParallelPython(target_geo=target_vol, proj_geo=proj_geo)
 
-    sinogram_array = projector.forward(target_array)
+    sinogram_array = np.asarray(projector.forward(target_array), dtype=np.float32)
     sino_obj = Sinogram(sinogram_array, proj_geo)
 
-    try:
-        fan_sino = rebinFanBeam(sino_obj, vial_width=target_array.shape[0], N_screen=(128, 128), n_write=1.0, throw_ratio=1.0)
-    except Exception:
-        fan_sino = sino_obj
-
-    recon_array = projector.backward(fan_sino.array if hasattr(fan_sino, "array") else fan_sino)
+    if isinstance(projector, NumbaParallelProjector):
+        fan_array = sinogram_array  # the Numba adjoint only accepts its own sinogram layout
+    else:
+        try:
+            fan_array = fan_rebinner(target_array.shape[0])(sino_obj)
+        except Exception:
+            fan_array = sinogram_array
+    recon_array = np.asarray(projector.backward(fan_array), dtype=np.float32)
+    assert recon_array.dtype == np.float32, recon_array.dtype
     recon_obj = Reconstruction(recon_array, proj_geo)
     dose_volume = recon_array
     return dose_volume, sino_obj, recon_obj
@@ -262,54 +612,91 @@ def simulate_cone_beam_projection(target_vol: Volume, n_angles=120):
 
 def resin_response_and_development(dose_volume, threshold=0.5):
     """Simple resin conversion and threshold-based development."""
-    D0 = np.percentile(dose_volume, 75) + 1e-8
-    response = 1.0 - np.exp(-dose_volume / D0)
-    developed = apply_threshold(response, threshold)
+    # 75th percentile via introselect (O(N)) rather than the full sort np.percentile performs
+    dose = as_aligned_float32(dose_volume)
+    flat = dose.reshape(-1)
+    k = int(0.75 * (flat.size - 1))
+    D0 = np.float32(np.partition(flat, k)[k] + np.float32(1e-8))
+    inv_D0 = np.float32(1.0) / D0
+    if HAS_NUMBA:
+        response = empty_aligned(dose.shape, np.float32)
+        resin_kernel(flat, response.reshape(-1), inv_D0)
+    else:
+        response = np.exp(dose * -inv_D0)
+        np.subtract(np.float32(1.0), response, out=response)
+    assert response.dtype == np.float32, response.dtype
+    # Single compare pass into a 1-byte mask; a fresh buffer per call because callers keep it
+    developed = empty_aligned(response.shape, np.uint8)
+    np.greater(response, np.float32(threshold), out=developed)
     return response, developed
 
 
 def visualize_all(title_prefix, target_vol, sinogram_obj, recon_obj, dose_volume, response, developed):
     """Unified visualization of pipeline outputs with fallbacks."""
-    target_array = target_vol.array if hasattr(target_vol, "array") else target_vol
-    sino_array = sinogram_obj.array if hasattr(sinogram_obj, "array") else sinogram_obj
-    recon_array = recon_obj.array if hasattr(recon_obj, "array") else recon_obj
-
-    show_volume(f"{title_prefix} Target", target_array)
-    show_sinogram(f"{title_prefix} Sinogram", sino_array)
-    show_volume(f"{title_prefix} Reconstruction (Dose)", recon_array)
+    show_volume(f"{title_prefix} Target", _as_array(target_vol))
+    show_sinogram(f"{title_prefix} Sinogram", _as_array(sinogram_obj))
+    show_volume(f"{title_prefix} Reconstruction (Dose)", _as_array(recon_obj))
     show_volume(f"{title_prefix} Resin Response", response)
     show_volume(f"{title_prefix} Developed (Thresholded)", developed)
 
 
+def _init_worker(n_threads):
+    # Split the cores between worker processes instead of every worker spawning a full Numba pool
+    if HAS_NUMBA:
+        nb.set_num_threads(n_threads)
+
+
+def run_pipeline_job(label, kind, source):
+    """Build one target (synthetic shape or mesh path), then project, reconstruct and develop it.
+
+    Returns the arguments for visualize_all, or None if an external mesh failed to load.
+    """
+    if kind == "synthetic":
+        print(f"\n--- Synthetic object: {source} ---")
+        vol = make_synthetic_object(source, resolution=64)
+    else:
+        print(f"\n--- External mesh: {source} ---")
+        try:
+            vol = load_external_mesh(source, resolution=64)
+        except Exception as e:
+            print(f"Failed to load {source}: {e}")
+            return None
+    dose, sino_obj, recon_obj = simulate_cone_beam_projection(vol, n_angles=90)
+    response, developed = resin_response_and_development(dose, threshold=0.5)
+    return label, vol, sino_obj, recon_obj, dose, response, developed
+
+
 def main():
     print("Starting Week 2 Toy Pipeline for VAMToolbox\n")
     explore_modules()
 
-    # Synthetic objects
-    for shape in ["sphere", "cube"]:
-        print(f"\n--- Synthetic object: {shape} ---")
-        vol = make_synthetic_object(shape, resolution=64)
-        dose, sino_obj, recon_obj = simulate_cone_beam_projection(vol, n_angles=90)
-        response, developed = resin_response_and_development(dose, threshold=0.5)
-        visualize_all(shape.capitalize(), vol, sino_obj, recon_obj, dose, response, developed)
-
-    # External mesh processing
+    # Synthetic objects, then any external meshes present; every job is independent
+    jobs = [(shape.capitalize(), "synthetic", shape) for shape in ["sphere", "cube"]]
     external_paths = ["ring.stl", "cube.stl"]
     for path in external_paths:
         if os.path.exists(path):
             basename = os.path.splitext(os.path.basename(path))[0]
-            print(f"\n--- External mesh: {path} ---")
-            try:
-                target_geo = load_external_mesh(path, resolution=64)
-            except Exception as e:
-                print(f"Failed to load {path}: {e}")
-                continue
-            dose, sino_obj, recon_obj = simulate_cone_beam_projection(target_geo, n_angles=90)
-            response, developed = resin_response_and_development(dose, threshold=0.5)
-            visualize_all(f"External {basename}", target_geo, sino_obj, recon_obj, dose, response, developed)
+            jobs.append((f"External {basename}", "mesh", path))
         else:
             print(f"[Info] Skipping missing external mesh '{path}'.")
 
+    # One process per job on CPU; GPU backends stay in-process so only one CUDA context exists
+    cpus = os.cpu_count() or 1
+    workers = 1 if (_tigre() is not None or _astra_cuda()) else min(len(jobs), cpus)
+    if workers > 1:
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker, initargs=(max(1, cpus // workers),)
+        ) as pool:
+            # map() yields in job order, so earlier results are shown while later ones still run
+            for result in pool.map(run_pipeline_job, *zip(*jobs)):
+                if result is not None:
+                    visualize_all(*result)
+    else:
+        for job in jobs:
+            result = run_pipeline_job(*job)
+            if result is not None:
+                visualize_all(*result)
+
     # Material / medium exploration (only if available)
     print("\n--- Material / Medium Exploration ---")
     if HAS_MEDIUM:
@@ -322,7 +709,13 @@ def main():
     else:
         print("Medium module not present; skipping material modeling.")
 
-    print("\nPipeline complete. Use the interactive windows (or fallback plots) to inspect results.")
+    if HEADLESS:
+        _png_writer().shutdown(wait=True)
+        print("\nPipeline complete. Figures were written as PNGs to the working directory.")
+    else:
+        print("\nPipeline complete. Use the interactive windows (or fallback plots) to inspect results.")
+        if _FIG is not None:
+            _pyplot().show()  # keep the reused fallback window open until the user closes it
 
 
 if __name__ == "__main__":
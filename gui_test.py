@@ -22,9 +22,20 @@ Run locally with `python gui_test.py` to bring up the interface.
 
 import sys
 import os
+import copy
+import errno
+import mmap
+import posixpath
 import time
 import socket
-from queue import Queue, Empty
+import select
+import selectors
+import stat
+import multiprocessing
+import threading
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+from functools import lru_cache, partial
 from pathlib import Path
 
 import shlex
@@ -33,28 +44,19 @@ from pathlib import Path, PurePosixPath
 from PyQt5.QtCore import Qt, QTimer, QObject, pyqtSignal, QThread, QEvent, pyqtSlot, QUrl
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QTabWidget, QVBoxLayout, QHBoxLayout,
-    QPushButton, QLabel, QLineEdit, QTextEdit, QFileDialog, QCheckBox, QMessageBox,
-    QSpinBox, QDoubleSpinBox, QGroupBox, QFormLayout, QComboBox, QDialog, QGridLayout
+    QPushButton, QLabel, QLineEdit, QPlainTextEdit, QFileDialog, QCheckBox, QMessageBox,
+    QSpinBox, QDoubleSpinBox, QGroupBox, QFormLayout, QComboBox, QDialog, QGridLayout,
+    QGraphicsScene, QGraphicsView, QFrame, QOpenGLWidget
 )
+from PyQt5.QtGui import QOpenGLContext
 from PyQt5.QtMultimedia import QMediaPlayer, QMediaContent
-from PyQt5.QtMultimediaWidgets import QVideoWidget
-import vamtoolbox as vam
-from vamtoolbox.geometry import TargetGeometry, ProjectionGeometry, Sinogram, Reconstruction
-import vamtoolbox.projector as projector_module
-import numpy as np
-import matplotlib.pyplot as plt
+from PyQt5.QtMultimediaWidgets import QGraphicsVideoItem
 
-# Compatibility for older code that uses np.bool
-np.bool = bool
-
-PIPELINE_OK = True
+# vamtoolbox / NumPy / matplotlib are only needed by the pipeline helpers, which import them
+PIPELINE_IMPORT_ERR = ""
 try:
     import pipeline_helpers as pipeline
-except Exception as e:
-    pipeline = None
-    PIPELINE_OK = False
-    PIPELINE_IMPORT_ERR = str(e)
-    import gui_test as pipeline
+    PIPELINE_OK = True
 except Exception as e:
     pipeline = None
     PIPELINE_OK = False
@@ -66,6 +68,19 @@ except ImportError:
     paramiko = None
 
 
+_TS_CACHE = (0, "")
+
+
+def _log_timestamp():
+    """Local time as 'YYYY-mm-dd HH:MM:SS', reformatted only when the wall-clock second changes."""
+    global _TS_CACHE
+    now = int(time.time())
+    if now != _TS_CACHE[0]:
+        # One tuple assignment, so the SSH and pipeline threads never see a torn pair
+        _TS_CACHE = (now, time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(now)))
+    return _TS_CACHE[1]
+
+
 def _job_plan_defaults():
     """Defaults for the generated job script so UI + helpers stay in sync."""
     return {
@@ -80,8 +95,9 @@ def _job_plan_defaults():
     }
 
 
-def _default_cfg():
-    """Return a baseline configuration dictionary loaded from pipeline helpers when available."""
+@lru_cache(maxsize=1)
+def _load_default_cfg():
+    """Parse and merge the baseline configuration once; _save_cfg invalidates it."""
     if pipeline and hasattr(pipeline, "load_config"):
         cfg = pipeline.load_config()
     else:
@@ -105,10 +121,18 @@ def _default_cfg():
     cfg["job_plan"] = merged_job
     return cfg
 
+
+def _default_cfg():
+    """Return a baseline configuration dictionary loaded from pipeline helpers when available."""
+    # Callers mutate the result, so hand out a copy of the cached parse
+    return copy.deepcopy(_load_default_cfg())
+
+
 def _save_cfg(cfg: dict):
     """Persist the configuration dictionary via pipeline helpers if they are present."""
     if pipeline and hasattr(pipeline, "save_config"):
         pipeline.save_config(cfg)
+        _load_default_cfg.cache_clear()
 
 
 class PasswordDialog(QDialog):
@@ -162,64 +186,136 @@ class PasswordDialog(QDialog):
 
 class SSHCommandWorker(QObject):
     """Background worker that connects over SSH, compiles master_queue, and streams commands/logs."""
+    UPLOAD_CHUNK_BYTES = 8 * 1024 * 1024
+    LOG_EMIT_MAX_CHARS = 4096
     log = pyqtSignal(str)
     success = pyqtSignal()
     failed = pyqtSignal(str)
     auth_failed = pyqtSignal()
     connection_lost = pyqtSignal(str)
     file_uploaded = pyqtSignal(str)
+    upload_progress = pyqtSignal(int)
+
+    def __init__(self, host, user, password, remote_dir, compress=False):
+        """Store connection info and prepare the compile command for the remote Jetson.
 
-    def __init__(self, host, user, password, remote_dir):
-        """Store connection info and prepare the compile command for the remote Jetson."""
+        Set compress=True to negotiate zlib on slow links; on the lab LAN it only costs CPU.
+        """
         super().__init__()
         self.host = host
         self.user = user
         self.password = password
+        self._password_bytes = password.encode("utf-8") + b"\n"
         self.remote_dir = remote_dir
+        self.compress = compress
         self.port = 22
-        self.compile_cmd = (
-            "g++ -std=c++17 -Wall -Wextra -pthread master_queue.cpp "
-            "Esp32UART.cpp TicController.cpp HeliCalHelper.cpp LED.cpp "
-            "DLPC900.cpp window_manager.cpp -I/usr/include/hidapi "
-            "-lhidapi-hidraw -o master_queue"
-        )
+        # Makefile (synced with the sources) builds each translation unit in parallel with -O2
+        self.compile_cmd = "make -j$(nproc) master_queue"
         self._client = None
         self._stdin = None
         self._stdout = None
         self._stderr = None
         self._channel = None
-        self._commands = Queue()
+        self._sftp = None
+        # deque append/popleft are atomic, and the wake socket below already does the signalling
+        self._commands = deque()
+        # Self-pipe so the worker can sleep in its selector until SSH output or a queued command arrives
+        self._wake_r, self._wake_w = socket.socketpair()
+        self._wake_r.setblocking(False)
+        self._wake_w.setblocking(False)
+        # Raw epoll on Linux (the Jetson and lab PCs); selectors elsewhere, e.g. Windows
+        self._wake_fd = self._wake_r.fileno()
+        if hasattr(select, "epoll"):
+            self._epoll = select.epoll()
+            self._selector = None
+        else:
+            self._epoll = None
+            self._selector = selectors.DefaultSelector()
+        self._watch(self._wake_r)
         self._running = False
         self._connected = False
+        self._known_remote_dirs = set()
 
     @pyqtSlot(str)
     def enqueue_command(self, command: str):
         """Queue a G-code style command that should be written to the remote shell."""
         cmd = (command or "").strip()
         if cmd:
-            self._commands.put(cmd)
+            self._commands.append(cmd)
+            self._wake()
 
     @pyqtSlot(str, str)
     def enqueue_upload(self, local_path: str, remote_path: str):
         """Queue an upload request that will be handled via SFTP."""
         if local_path and remote_path:
-            self._commands.put(("__upload__", local_path, remote_path))
+            self._commands.append(("__upload__", local_path, remote_path))
+            self._wake()
 
     @pyqtSlot(str, bool)
     def enqueue_shell(self, command: str, needs_sudo: bool = False):
         """Queue a shell command that should execute on the Jetson."""
         cmd = (command or "").strip()
         if cmd:
-            self._commands.put(("__shell__", cmd, needs_sudo))
+            self._commands.append(("__shell__", cmd, needs_sudo))
+            self._wake()
 
     @pyqtSlot()
     def stop(self):
         """Signal the worker loop to exit and close the SSH session."""
-        self._commands.put("__disconnect__")
+        self._commands.append("__disconnect__")
+        self._wake()
+
+    def _wake(self):
+        """Nudge the worker loop out of its selector wait after queueing something."""
+        try:
+            self._wake_w.send(b"\0")
+        except OSError:
+            pass  # buffer already full (worker is awake anyway) or socket closed
+
+    def _wait_for_activity(self, timeout=1.0):
+        """Block until master_queue output is readable or a command was queued."""
+        if self._epoll is not None:
+            woke = any(fd == self._wake_fd for fd, _ in self._epoll.poll(timeout))
+        else:
+            woke = any(key.fd == self._wake_fd for key, _ in self._selector.select(timeout))
+        if woke:
+            try:
+                while self._wake_r.recv(4096):
+                    pass
+            except OSError:
+                pass
+
+    def _watch(self, fileobj):
+        """Add a socket or paramiko channel to the set the worker sleeps on."""
+        if self._epoll is not None:
+            self._epoll.register(fileobj.fileno(), select.EPOLLIN)
+        else:
+            self._selector.register(fileobj, selectors.EVENT_READ)
+
+    def _open_socket(self):
+        """Connect a TCP socket to the Jetson tuned for both bulk uploads and single G-code lines."""
+        family, socktype, proto, _, addr = socket.getaddrinfo(
+            self.host, self.port, socket.AF_UNSPEC, socket.SOCK_STREAM
+        )[0]
+        sock = socket.socket(family, socktype, proto)
+        try:
+            # G-code lines are tiny writes; don't let Nagle hold them back waiting for an ACK.
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            # Buffers must be sized before connect() so the kernel advertises a large TCP window.
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 32 * 1024 * 1024)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 32 * 1024 * 1024)
+            # Kernel-level keepalive backs up the SSH keepalive so a dead peer is noticed while idle.
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            sock.settimeout(10)
+            sock.connect(addr)
+        except Exception:
+            sock.close()
+            raise
+        return sock
 
     def _emit_log(self, message):
         """Emit a timestamped log line so the GUI text consoles stay in sync."""
-        ts = time.strftime("%Y-%m-%d %H:%M:%S")
+        ts = _log_timestamp()
         self.log.emit(f"[SSH] [{ts}] {message}")
 
     def run(self):
@@ -240,33 +336,31 @@ class SSHCommandWorker(QObject):
                 timeout=10,
                 allow_agent=False,
                 look_for_keys=False,
+                compress=self.compress,
+                sock=self._open_socket(),
             )
             self._emit_log("SSH connection established.")
-            self._sync_critical_sources()
-            self._run_remote_command(f"cd {self.remote_dir} && {self.compile_cmd}")
+            transport = self._client.get_transport()
+            transport.set_keepalive(15)
+            # Deeper per-channel window so SFTP uploads are not RTT-bound (set before opening the channel);
+            # 256 KiB packets let sshd stream master_queue output in fewer, larger packets
+            transport.default_window_size = 1 << 27
+            transport.default_max_packet_size = 1 << 18
+            self._sftp = self._client.open_sftp()
+            self._sftp.get_channel().settimeout(None)
+            synced = self._sync_critical_sources()
+            if not synced and self._master_queue_is_current():
+                self._emit_log("[BUILD] master_queue is up to date; skipping compile.")
+            else:
+                self._run_remote_command(f"cd {self.remote_dir} && {self.compile_cmd}")
             self._start_master_queue()
             self._running = True
             self._connected = True
             self.success.emit()
             while self._running:
+                self._wait_for_activity()
                 self._pump_stdout()
-                try:
-                    cmd = self._commands.get(timeout=0.2)
-                except Empty:
-                    continue
-                if isinstance(cmd, tuple):
-                    tag = cmd[0]
-                    if tag == "__upload__":
-                        _, local_path, remote_path = cmd
-                        self._handle_upload(local_path, remote_path)
-                        continue
-                    if tag == "__shell__":
-                        _, shell_cmd, needs_sudo = cmd
-                        self._run_remote_command(shell_cmd, needs_sudo=needs_sudo)
-                        continue
-                if cmd == "__disconnect__":
-                    break
-                self._send_line(cmd)
+                self._drain_commands()
             self._emit_log("Stopping remote session.")
         except paramiko.AuthenticationException:
             self.auth_failed.emit()
@@ -279,21 +373,65 @@ class SSHCommandWorker(QObject):
             self._running = False
             self._cleanup()
 
+    def _drain_commands(self):
+        """Process everything queued since the last wake, coalescing consecutive G-code lines into one write."""
+        batch = []
+        while self._running:
+            try:
+                cmd = self._commands.popleft()
+            except IndexError:
+                break
+            if isinstance(cmd, str) and cmd != "__disconnect__":
+                batch.append(cmd)
+                continue
+            if batch:
+                self._send_lines(batch)
+                batch = []
+            self._process_command(cmd)
+        if batch:
+            self._send_lines(batch)
+
+    def _process_command(self, cmd):
+        """Dispatch one queued item: upload, shell command, disconnect, or a G-code line."""
+        if isinstance(cmd, tuple):
+            tag = cmd[0]
+            if tag == "__upload__":
+                _, local_path, remote_path = cmd
+                self._handle_upload(local_path, remote_path)
+                return
+            if tag == "__shell__":
+                _, shell_cmd, needs_sudo = cmd
+                self._run_remote_command(shell_cmd, needs_sudo=needs_sudo)
+                return
+        if cmd == "__disconnect__":
+            self._running = False
+            return
+        self._send_lines([cmd])
+
     def _run_remote_command(self, command, needs_sudo=False):
-        """Execute a one-shot command (compile, etc.) and surface stdout/stderr to the GUI log."""
+        """Execute a one-shot command (compile, etc.) and stream its merged stdout/stderr to the GUI log."""
         self._emit_log(f"Running: {command}")
         stdin, stdout, stderr = self._client.exec_command(command, get_pty=needs_sudo)
+        channel = stdout.channel
+        channel.set_combine_stderr(True)
         try:
             if needs_sudo:
-                stdin.write(self.password + "\n")
+                stdin.write(self._password_bytes)
                 stdin.flush()
-            out = stdout.read().decode(errors="ignore").strip()
-            err = stderr.read().decode(errors="ignore").strip()
-            exit_status = stdout.channel.recv_exit_status()
-            if out:
-                self._emit_log(out)
-            if err:
-                self._emit_log(f"[stderr] {err}")
+            # Carry partial lines between chunks so long compiler diagnostics are never split
+            pending = bytearray()
+            while True:
+                if channel.recv_ready():
+                    self._log_complete_lines(pending, channel.recv(65536))
+                    continue
+                if channel.exit_status_ready():
+                    break
+                select.select([channel], [], [], 0.1)
+            while channel.recv_ready():
+                self._log_complete_lines(pending, channel.recv(65536))
+            if pending:
+                self._log_output(bytes(pending))
+            exit_status = channel.recv_exit_status()
             if exit_status != 0:
                 raise RuntimeError(f"Remote command failed ({exit_status})")
         finally:
@@ -301,47 +439,153 @@ class SSHCommandWorker(QObject):
             stdout.close()
             stderr.close()
 
+    def _log_complete_lines(self, pending: bytearray, data: bytes):
+        """Append data to pending and log everything up to its last newline."""
+        pending += data
+        cut = pending.rfind(b"\n") + 1
+        if cut:
+            self._log_output(bytes(pending[:cut]))
+            del pending[:cut]
+
+    def _log_output(self, data: bytes):
+        """Forward the non-empty lines of a raw remote output chunk to the GUI log as one block."""
+        # Split and strip in bytes; only the lines that are actually shown get decoded
+        lines = [line.strip() for line in data.translate(None, b"\r").split(b"\n")]
+        lines = [line for line in lines if line]
+        if lines:
+            ts = _log_timestamp()
+            # Split into blocks of at most LOG_EMIT_MAX_CHARS so a burst of compiler diagnostics can't
+            # stall the log widgets with one huge append; every line is still delivered.
+            block, size = [], 0
+            for line in lines:
+                text = f"[SSH] [{ts}] {line.decode(errors='ignore')}"
+                if block and size + len(text) + 1 > self.LOG_EMIT_MAX_CHARS:
+                    self.log.emit("\n".join(block))
+                    block, size = [], 0
+                block.append(text)
+                size += len(text) + 1
+            self.log.emit("\n".join(block))
+
     def _abs_remote_path(self, path: str) -> str:
         if path.startswith("/"):
             return path
         clean = path.lstrip("./")
         return f"/home/{self.user}/{clean}"
 
+    def _ensure_remote_dir(self, remote_dir: str):
+        """Create remote_dir and any missing parents over the shared SFTP session."""
+        if not remote_dir or remote_dir in self._known_remote_dirs:
+            return
+        try:
+            self._sftp.stat(remote_dir)  # usual case: one round trip and done
+            self._known_remote_dirs.add(remote_dir)
+            return
+        except IOError:
+            pass
+        current = PurePosixPath("/")
+        for part in PurePosixPath(remote_dir).parts[1:]:
+            current = current / part
+            try:
+                self._sftp.stat(str(current))
+            except IOError:
+                self._sftp.mkdir(str(current))
+        self._known_remote_dirs.add(remote_dir)
+
     def _handle_upload(self, local_path: str, remote_path: str):
         try:
             abs_path = self._abs_remote_path(remote_path)
-            remote_dir = os.path.dirname(abs_path)
-            self._run_remote_command(f"mkdir -p {shlex.quote(remote_dir)}")
-            sftp = self._client.open_sftp()
-            try:
-                sftp.put(local_path, abs_path)
-            finally:
-                sftp.close()
+            remote_dir = posixpath.dirname(abs_path)
+            self._ensure_remote_dir(remote_dir)
+            last_pct = [-1]
+
+            def progress_callback(sent, total):
+                # Only signal the GUI when the percentage moves.
+                pct = (sent * 100) // total if total else 100
+                if pct != last_pct[0]:
+                    last_pct[0] = pct
+                    self.upload_progress.emit(pct)
+
+            # Pipelined writes keep many SFTP requests in flight instead of waiting on each ACK.
+            # The local file is memory-mapped and handed over as zero-copy slices; the remote
+            # handle is unbuffered so paramiko doesn't copy them into its own write buffer first.
+            with open(local_path, "rb") as lf, self._sftp.file(abs_path, "wb", bufsize=0) as rf:
+                rf.set_pipelined(True)
+                total = os.fstat(lf.fileno()).st_size
+                if total:
+                    with mmap.mmap(lf.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        view = memoryview(mm)
+                        try:
+                            for start in range(0, total, self.UPLOAD_CHUNK_BYTES):
+                                end = min(start + self.UPLOAD_CHUNK_BYTES, total)
+                                rf.write(view[start:end])
+                                progress_callback(end, total)
+                        finally:
+                            view.release()
+                else:
+                    progress_callback(0, 0)
             self._emit_log(f"[UPLOAD] {local_path} -> {abs_path}")
             self.file_uploaded.emit(abs_path)
         except Exception as exc:
             self._emit_log(f"[UPLOAD] Failed: {exc}")
 
-    def _sync_critical_sources(self):
-        """Force-upload headers/sources that have been corrupted on the Jetson."""
+    def _sync_critical_sources(self) -> bool:
+        """Force-upload headers/sources that have been corrupted on the Jetson.
+
+        Files whose remote copy already matches are left untouched so their mtimes (and make's
+        view of what is up to date) do not change. Returns True if anything was uploaded.
+        """
         local_root = Path(__file__).resolve().parent
-        for rel in ("HeliCalHelper.h", "HeliCalHelper.cpp"):
+        uploaded = False
+        for rel in ("HeliCalHelper.h", "HeliCalHelper.cpp", "Makefile"):
             local_file = local_root / rel
             if not local_file.exists():
                 continue
-            remote_path = f"{self.remote_dir.rstrip('/')}/{rel}"
+            remote_path = posixpath.join(self.remote_dir, rel)
+            if self._remote_file_matches(local_file, self._abs_remote_path(remote_path)):
+                continue
             self._emit_log(f"[SYNC] Ensuring {rel} is up to date on the Jetson ...")
             self._handle_upload(str(local_file), remote_path)
+            uploaded = True
+        return uploaded
+
+    def _remote_file_matches(self, local_file: Path, abs_path: str) -> bool:
+        """Compare a small local file with its remote copy (size first, then contents)."""
+        data = local_file.read_bytes()
+        try:
+            if self._sftp.stat(abs_path).st_size != len(data):
+                return False
+            with self._sftp.file(abs_path, "rb") as rf:
+                return rf.read() == data
+        except IOError:
+            return False
+
+    def _master_queue_is_current(self) -> bool:
+        """True when the remote master_queue binary is newer than every .cpp/.h file and the Makefile."""
+        try:
+            entries = self._sftp.listdir_attr(self._abs_remote_path(self.remote_dir))
+        except IOError:
+            return False
+        binary_mtime = None
+        newest_source = 0
+        for entry in entries:
+            if entry.filename == "master_queue":
+                binary_mtime = entry.st_mtime
+            elif entry.filename == "Makefile" or entry.filename.endswith((".cpp", ".h")):
+                newest_source = max(newest_source, entry.st_mtime)
+        return binary_mtime is not None and binary_mtime > newest_source
 
     def _start_master_queue(self):
         """Launch master_queue in interactive mode so subsequent commands run live."""
         self._emit_log("Launching master_queue (interactive).")
         self._stdin, self._stdout, self._stderr = self._client.exec_command(
-            f"cd {self.remote_dir} && sudo -S ./master_queue",
+            f"cd {self.remote_dir} && sudo -S -p '' ./master_queue",
             get_pty=True,
         )
         self._channel = self._stdout.channel
-        self._stdin.write(self.password + "\n")
+        self._watch(self._channel)
+        # sudo -S reads the password from stdin, so send it straight away rather than polling for a
+        # prompt; -p '' keeps the locale-dependent prompt text out of the log stream.
+        self._stdin.write(self._password_bytes)
         self._stdin.flush()
 
     def _pump_stdout(self):
@@ -350,22 +594,24 @@ class SSHCommandWorker(QObject):
             return
         try:
             while self._channel.recv_ready():
-                data = self._channel.recv(4096).decode(errors="ignore")
-                if data:
-                    for line in data.replace("\r", "").splitlines():
-                        if line.strip():
-                            self._emit_log(line.strip())
+                self._log_output(self._channel.recv(65536))
             if self._channel.exit_status_ready():
                 raise RuntimeError("Remote process exited.")
         except Exception:
             raise
 
-    def _send_line(self, command):
-        """Write a sanitized command to the remote stdin channel."""
+    def _send_lines(self, commands):
+        """Write sanitized commands to the remote stdin channel with a single write/flush."""
         if not self._stdin:
             raise RuntimeError("Remote session not ready.")
-        self._emit_log(f"> {command}")
-        self._stdin.write(command.strip() + "\n")
+        # Queue entries may be multi-line blocks (jog/start/end macros); log and send line by line
+        lines = [line.strip() for command in commands for line in command.split("\n")]
+        lines = [line for line in lines if line]
+        if not lines:
+            return
+        ts = _log_timestamp()
+        self.log.emit("\n".join(f"[SSH] [{ts}] > {line}" for line in lines))
+        self._stdin.write(("\n".join(lines) + "\n").encode("utf-8"))
         self._stdin.flush()
 
     def _cleanup(self):
@@ -391,8 +637,19 @@ class SSHCommandWorker(QObject):
                     self._channel.close()
                 except Exception:
                     pass
+            if self._sftp:
+                try:
+                    self._sftp.close()
+                except Exception:
+                    pass
             if self._client:
                 self._client.close()
+            (self._epoll or self._selector).close()
+            for sock in (self._wake_r, self._wake_w):
+                try:
+                    sock.close()
+                except Exception:
+                    pass
         finally:
             self._client = None
             self._stdin = None
@@ -406,19 +663,41 @@ class PipelineWorker(QObject):
     log = pyqtSignal(str)
     done = pyqtSignal(str)
     failed = pyqtSignal(str)
+    CANCEL_POLL_S = 0.1
+
+    def __init__(self, stl="", out_dir="", cfg=None, demo_mode=False, executor=None):
+        """Record paths/config, then reuse the shared pipeline module when run() executes.
 
-    def __init__(self, stl, out_dir, cfg, demo_mode):
-        """Record paths/config, then reuse the shared pipeline module when run() executes."""
+        When `executor` is given, voxelization + projection are submitted to it (a process pool
+        in the GUI) and this thread only waits for the result.
+        """
         super().__init__()
         self.stl = stl
         self.out_dir = out_dir
+        self.cfg = cfg or {}
+        self.demo_mode = demo_mode
+        self.executor = executor
+        self.job_plan_path = ""
+        self._cancel = threading.Event()
+
+    def cancel(self):
+        """Stop waiting on an in-flight projection job; safe to call from the GUI thread."""
+        self._cancel.set()
+
+    @pyqtSlot(str, str, dict, bool)
+    def start(self, stl, out_dir, cfg, demo_mode):
+        """Take the inputs for the next run and execute it; lets one long-lived worker serve every click."""
+        self.stl = stl
+        self.out_dir = out_dir
         self.cfg = cfg
         self.demo_mode = demo_mode
         self.job_plan_path = ""
+        self._cancel.clear()
+        self.run()
 
     def _emit_log(self, msg):
         """Helper to emit plain pipeline log messages with timestamps."""
-        ts = time.strftime("%Y-%m-%d %H:%M:%S")
+        ts = _log_timestamp()
         self.log.emit(f"[{ts}] {msg}")
 
     def run(self):
@@ -426,18 +705,43 @@ class PipelineWorker(QObject):
         if not PIPELINE_OK:
             self.failed.emit("Pipeline helpers not available (gui_test.py import failed).")
             return
+        # Created here rather than on the click: a slow or network-mounted output folder must not stall the GUI
+        try:
+            if self.out_dir:
+                os.makedirs(self.out_dir, exist_ok=True)
+        except OSError as e:
+            self.failed.emit(f"Output dir error: {e}")
+            return
         try:
             resolved = pipeline.resolve_stl_path(self.stl if self.stl else None, self.demo_mode)
             self._emit_log(f"=== Run start: STL='{resolved}' (demo={self.demo_mode}) ===")
-            tg = pipeline.voxelize_stl(resolved, self.cfg["resolution"])
-            recon_array, sino, recon = pipeline.run_projection(tg, self.cfg["num_angles"], ray_type=self.cfg.get("ray_type", "parallel"))
-            spath, rpath = pipeline.save_projection_images(self.out_dir, sino, recon_array)
-            montage_path = pipeline.save_angle_montage(self.out_dir, sino, n_cols=10)
+            ray_type = self.cfg.get("ray_type", "parallel")
+            if self.executor is not None and hasattr(pipeline, "voxelize_and_project"):
+                future = self.executor.submit(
+                    pipeline.voxelize_and_project, resolved, self.cfg["resolution"], self.cfg["num_angles"], ray_type
+                )
+                # Poll instead of blocking in result() so closing the window can abandon the run
+                while True:
+                    try:
+                        recon_array, sino, recon = future.result(timeout=self.CANCEL_POLL_S)
+                        break
+                    except FutureTimeoutError:
+                        if self._cancel.is_set():
+                            future.cancel()
+                            self._emit_log("=== Run cancelled ===")
+                            return
+            else:
+                tg = pipeline.voxelize_stl(resolved, self.cfg["resolution"])
+                recon_array, sino, recon = pipeline.run_projection(tg, self.cfg["num_angles"], ray_type=ray_type)
+            if hasattr(pipeline, "save_all_from_sino"):
+                spath, rpath, montage_path, vpath = pipeline.save_all_from_sino(self.out_dir, sino, recon_array, n_cols=10)
+            else:
+                spath, rpath = pipeline.save_projection_images(self.out_dir, sino, recon_array)
+                montage_path = pipeline.save_angle_montage(self.out_dir, sino, n_cols=10)
+                # Generate video preview
+                vpath = pipeline.save_reconstruction_video(self.out_dir, sino)
             gpath = pipeline.write_gcode_from_recon_slice(self.out_dir, recon_array, self.cfg)
 
-            # Generate video preview
-            vpath = pipeline.save_reconstruction_video(self.out_dir, sino)
-
             job_script_path = ""
             if hasattr(pipeline, "write_helical_job_script"):
                 assets = {
@@ -467,11 +771,83 @@ class PipelineWorker(QObject):
             self._emit_log("=== Run done ===")
             self.done.emit(self.out_dir)
         except Exception as e:
+            if self._cancel.is_set():
+                # Closing the window kills the pool, so the pending result fails with BrokenProcessPool
+                self._emit_log("=== Run cancelled ===")
+                return
             self.failed.emit(str(e))
 
 
+@lru_cache(maxsize=1)
+def _opengl_available() -> bool:
+    """Whether an OpenGL context can be created (headless/remote sessions may have none)."""
+    return QOpenGLContext().create()
+
+
+class VideoPreviewView(QGraphicsView):
+    """GL-backed view for the local MP4 preview.
+
+    QMediaPlayer renders into a QGraphicsVideoItem; on a QOpenGLWidget viewport each frame is
+    uploaded straight into a texture (or used as one when the decoder hands out GL handles)
+    instead of going through QVideoWidget's per-frame QImage conversion. Without OpenGL the
+    view keeps its raster viewport.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.video_item = QGraphicsVideoItem()
+        self.setScene(QGraphicsScene(self))
+        self.scene().addItem(self.video_item)
+        if _opengl_available():
+            self.setViewport(QOpenGLWidget())
+        self.setFrameShape(QFrame.NoFrame)
+        self.setBackgroundBrush(Qt.black)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.video_item.nativeSizeChanged.connect(self._on_native_size_changed)
+
+    def _on_native_size_changed(self, size):
+        if not size.isEmpty():
+            self.video_item.setSize(size)
+        self._fit()
+
+    def _fit(self):
+        self.fitInView(self.video_item, Qt.KeepAspectRatio)
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._fit()
+
+
 class HeliCALQt(QMainWindow):
     """Top-level window that groups the pipeline, encoder, and G-code tools for the control station."""
+    pipeline_requested = pyqtSignal(str, str, dict, bool)
+    PROBE_TIMEOUT_S = 3.0
+    PROBE_POLL_MS = 50
+    LOG_FLUSH_MS = 50
+    LOG_FLUSH_BATCH = 200
+    # Native pickers, minus per-entry icon lookups and symlink resolution (both stat every file)
+    FILE_DIALOG_OPTIONS = QFileDialog.DontUseCustomDirectoryIcons | QFileDialog.DontResolveSymlinks
+    _CONNECT_IN_PROGRESS = {0, errno.EINPROGRESS, errno.EWOULDBLOCK, getattr(errno, "WSAEWOULDBLOCK", errno.EWOULDBLOCK)}
+    # Whole projector start-up as one remote script so it costs a single exec channel
+    _VIDEO_DISPLAY_READY = "[VIDEO] Display ready"
+    # The ready marker is assembled by printf so it only appears in the remote output, never in the
+    # worker's "Running: ..." echo of this script
+    _VIDEO_DISPLAY_PROBE = (
+        "if DISPLAY=:0 xset q >/dev/null 2>&1; "
+        "then printf \"[VIDEO] Display %s\\n\" ready; else echo \"[VIDEO] Display locked. Log into the Jetson desktop.\"; fi"
+    )
+    _VIDEO_CMD_TEMPLATE = "; ".join([
+        "pkill mpv >/dev/null 2>&1 || true",
+        "DISPLAY=:0 nohup mpv --vo=gpu --hwdec=auto --title=ProjectorVideo "
+        "--keep-open --fullscreen --loop=inf --no-terminal --video-rotate=180 "
+        "{path} >/tmp/mpv.log 2>&1 &",
+        "sleep 0.5",
+        "DISPLAY=:0 xdotool search --name ProjectorVideo windowmove 1920 0 || true",
+        "DISPLAY=:0 xdotool search --name ProjectorVideo windowsize 2560 1600 || true",
+        "DISPLAY=:0 xdotool search --name ProjectorVideo windowactivate --sync key space || true",
+    ])
+
     def __init__(self):
         """Set up UI widgets, timers, and background workers for the three application tabs."""
         super().__init__()
@@ -479,6 +855,7 @@ class HeliCALQt(QMainWindow):
         self.resize(980, 720)
 
         self.ssh_host = "192.168.0.123"
+        self.ssh_port = 22
         self.ssh_user = "jacob"
         self.remote_dir = "Desktop/HeliCAL_Final"
         self.wifi_name = "AirBears9000"
@@ -487,14 +864,17 @@ class HeliCALQt(QMainWindow):
         self._ssh_connected = False
         self._password_dialog_open = False
         self._ssh_connecting = False
+        self._probe_pending = False
         self.txt_gcode_log = None
         self.le_jog_step = None
         self.le_jog_feed = None
+        self._jog_feed_suffix = ""
         self.le_video = None
         self.le_terminal_input = None
         self.remote_video_dir = f"{self.remote_dir}/Videos"
         self.current_video_remote_path = ""
         self._video_login_prompted = False
+        self._display_ok = False
 
         self.tabs = QTabWidget()
         self.connection_indicator = QLabel()
@@ -532,10 +912,18 @@ class HeliCALQt(QMainWindow):
 
         self._thread = None
         self._worker = None
+        self._pipeline_pool = None
+        self._pool_foreign_children = set()
         self._ssh_thread = None
         self._ssh_worker = None
         self.last_job_plan_path = ""
 
+        # SSH output arrives one signal per block; queue it and repaint the consoles at most every tick
+        self._log_queue = deque()
+        self._log_flush_timer = QTimer(self)
+        self._log_flush_timer.setInterval(self.LOG_FLUSH_MS)
+        self._log_flush_timer.timeout.connect(self._flush_log_queue)
+
         QTimer.singleShot(750, self._initiate_connection)
 
     def _update_connection_indicator(self):
@@ -567,19 +955,61 @@ class HeliCALQt(QMainWindow):
             self._append_log("[SSH] Paramiko is not installed; skipping automatic connection.")
             QMessageBox.warning(self, "SSH Unavailable", "Paramiko is required for remote connection.")
             return
-        if not self._probe_ssh_host():
-            self._show_connection_failed_message()
+        if self._probe_pending:
             return
-        self._prompt_remote_password()
+        self._probe_ssh_host(self._on_probe_result)
+
+    def _on_probe_result(self, reachable: bool):
+        """Continue the connection workflow once the port probe has an answer."""
+        if reachable:
+            self._prompt_remote_password()
+        else:
+            self._show_connection_failed_message()
 
-    def _probe_ssh_host(self):
-        """Quickly test whether the Jetson is reachable on port 22 before asking for a password."""
+    def _probe_ssh_host(self, on_result):
+        """Test whether the Jetson is reachable on port 22 before asking for a password.
+
+        The connect is non-blocking and polled from a QTimer, so an unreachable Jetson never
+        freezes the window; on_result(bool) is called exactly once.
+        """
+        sock = None
         try:
-            with socket.create_connection((self.ssh_host, 22), timeout=3):
-                return True
+            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            sock.setblocking(False)
+            err = sock.connect_ex((self.ssh_host, self.ssh_port))
+            if err not in self._CONNECT_IN_PROGRESS:
+                raise OSError(err, os.strerror(err))
         except OSError as exc:
+            if sock is not None:
+                sock.close()
             self._append_log(f"[SSH] Probe error: {exc}")
-            return False
+            on_result(False)
+            return
+        self._probe_pending = True
+        deadline = time.monotonic() + self.PROBE_TIMEOUT_S
+
+        def finish(ok, error=None):
+            sock.close()
+            self._probe_pending = False
+            if error:
+                self._append_log(f"[SSH] Probe error: {error}")
+            on_result(ok)
+
+        def check():
+            # Windows reports a refused connect in the exceptional set, POSIX via SO_ERROR
+            _, writable, failed = select.select([], [sock], [sock], 0)
+            if writable or failed:
+                err = sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR)
+                if err or failed:
+                    finish(False, os.strerror(err) if err else "connection failed")
+                else:
+                    finish(True)
+            elif time.monotonic() >= deadline:
+                finish(False, "timed out")
+            else:
+                QTimer.singleShot(self.PROBE_POLL_MS, check)
+
+        check()
 
     def _show_connection_failed_message(self):
         """Display a friendly reminder of the Wi-Fi credentials when the probe or login fails."""
@@ -656,6 +1086,7 @@ class HeliCALQt(QMainWindow):
         self._ssh_worker.auth_failed.connect(self._on_ssh_auth_failed)
         self._ssh_worker.connection_lost.connect(self._on_ssh_connection_lost)
         self._ssh_worker.file_uploaded.connect(self._on_remote_file_uploaded)
+        self._ssh_worker.upload_progress.connect(self._on_upload_progress)
         self._ssh_thread.finished.connect(self._on_ssh_thread_finished)
         self._ssh_thread.finished.connect(self._ssh_thread.deleteLater)
         self._ssh_thread.start()
@@ -730,11 +1161,27 @@ class HeliCALQt(QMainWindow):
     def _reset_video_prompt(self):
         """Allow the video helper to remind the user about the Jetson desktop state."""
         self._video_login_prompted = False
+        self._display_ok = False
 
     def _append_connection_log(self, msg: str):
-        """Mirror SSH log messages into both the pipeline and G-code consoles."""
-        self._append_log(msg)
-        self._append_gcode_log(msg)
+        """Queue SSH log messages for both the pipeline and G-code consoles."""
+        if self._VIDEO_DISPLAY_READY in msg:
+            self._display_ok = True
+        self._log_queue.append(msg)
+        if not self._log_flush_timer.isActive():
+            self._log_flush_timer.start()
+
+    def _flush_log_queue(self):
+        """Append up to LOG_FLUSH_BATCH queued SSH messages to both consoles in one go."""
+        batch = []
+        while self._log_queue and len(batch) < self.LOG_FLUSH_BATCH:
+            batch.append(self._log_queue.popleft())
+        if batch:
+            text = "\n".join(batch)
+            self._append_log(text)
+            self._append_gcode_log(text)
+        if not self._log_queue:
+            self._log_flush_timer.stop()
 
     def _build_tab_pipeline(self):
         """Create the first tab that lets users pick STL files, tweak parameters, and run the pipeline."""
@@ -824,6 +1271,7 @@ class HeliCALQt(QMainWindow):
         job_form.addRow("", self.cb_job_metrology)
         job_group.setLayout(job_form)
         v.addWidget(job_group)
+        self._bind_cfg_widgets()
 
         row3 = QHBoxLayout()
         self.btn_run = QPushButton("Run Pipeline")
@@ -835,37 +1283,45 @@ class HeliCALQt(QMainWindow):
         row3.addWidget(self.btn_save_cfg)
         v.addLayout(row3)
 
-        self.txt_log = QTextEdit(); self.txt_log.setReadOnly(True)
+        self.txt_log = QPlainTextEdit(); self.txt_log.setReadOnly(True)
+        self.txt_log.setMaximumBlockCount(5000)
         v.addWidget(QLabel("Status Log (pipeline):"))
         v.addWidget(self.txt_log, 1)
 
         if not PIPELINE_OK:
-            self._append_log(f"[WARN] Could not import pipeline helpers from gui_test.py: {PIPELINE_IMPORT_ERR}")
+            self._append_log(f"[WARN] Could not import pipeline_helpers: {PIPELINE_IMPORT_ERR}")
             self.btn_run.setEnabled(False)
 
         self.tabs.addTab(tab, "Pipeline")
 
     def _append_log(self, msg: str):
-        """Send a string to the pipeline status QTextEdit."""
-        self.txt_log.append(msg)
+        """Send a string to the pipeline status log."""
+        self.txt_log.appendPlainText(msg)
 
     def _browse_stl(self):
         """Open a file picker that lets the user choose an STL asset."""
-        path, _ = QFileDialog.getOpenFileName(self, "Choose STL", "", "STL files (*.stl);;All files (*.*)")
+        path, _ = QFileDialog.getOpenFileName(
+            self, "Choose STL", "", "STL files (*.stl);;All files (*.*)", options=self.FILE_DIALOG_OPTIONS
+        )
         if path:
             self.le_stl.setText(path)
             self._set_video_preview_source("")
 
     def _browse_video(self):
         """Allow the user to pick a local MP4 that will be uploaded to the Jetson."""
-        path, _ = QFileDialog.getOpenFileName(self, "Choose Video", "", "MP4 files (*.mp4)")
+        path, _ = QFileDialog.getOpenFileName(
+            self, "Choose Video", "", "MP4 files (*.mp4)", options=self.FILE_DIALOG_OPTIONS
+        )
         if path:
             self.le_video.setText(path)
             self._set_video_preview_source(path)
 
     def _browse_outdir(self):
         """Allow the operator to point the output directory at a convenient writable folder."""
-        d = QFileDialog.getExistingDirectory(self, "Choose Output Directory", self.le_out.text())
+        d = QFileDialog.getExistingDirectory(
+            self, "Choose Output Directory", self.le_out.text(),
+            options=QFileDialog.ShowDirsOnly | self.FILE_DIALOG_OPTIONS,
+        )
         if d:
             self.le_out.setText(d)
 
@@ -875,20 +1331,29 @@ class HeliCALQt(QMainWindow):
         if not path:
             QMessageBox.warning(self, "Video", "Select an MP4 file to upload.")
             return
-        if not os.path.exists(path):
-            QMessageBox.warning(self, "Video", "Video file does not exist.")
-            return
         if not path.lower().endswith(".mp4"):
             QMessageBox.warning(self, "Video", "Only MP4 videos are supported.")
             return
+        # A single stat answers "exists and is a regular file"; on a slow network share it can take
+        # seconds, so show a busy cursor rather than leave the window looking frozen.
+        QApplication.setOverrideCursor(Qt.WaitCursor)
+        try:
+            st = os.stat(path)
+        except OSError:
+            st = None
+        finally:
+            QApplication.restoreOverrideCursor()
+        if st is None or not stat.S_ISREG(st.st_mode):
+            QMessageBox.warning(self, "Video", "Video file does not exist.")
+            return
         if not self._ensure_remote_ready():
             return
         filename = os.path.basename(path)
-        remote_rel = PurePosixPath(self.remote_video_dir) / filename
-        self.current_video_remote_path = str(remote_rel)
+        remote_rel = posixpath.join(self.remote_video_dir, filename)
+        self.current_video_remote_path = remote_rel
         self._append_log(f"[VIDEO] Uploading {filename} ...")
-        self._ssh_worker.enqueue_upload(path, str(remote_rel))
-        self._set_video_preview_source(path)
+        self._ssh_worker.enqueue_upload(path, remote_rel)
+        self._set_video_preview_source(path, st)
 
     def _save_cfg_clicked(self):
         """Collect the currently shown parameter values and pass them to the helper for persistence."""
@@ -896,18 +1361,32 @@ class HeliCALQt(QMainWindow):
         _save_cfg(cfg)
         QMessageBox.information(self, "Saved", "Configuration saved.")
 
-    def _set_video_preview_source(self, path: str):
-        """Load the selected MP4 into the preview tab."""
+    def _set_video_preview_source(self, path: str, st=None):
+        """Load the selected MP4 into the preview tab; `st` reuses a stat the caller already did."""
         if not path or not hasattr(self, "video_player"):
             return
-        url = QUrl.fromLocalFile(path)
-        self.video_player.setMedia(QMediaContent(url))
+        # Browse + upload both point the preview at the same file; re-setting it makes Qt re-probe
+        # the codec (and re-raise its error dialog), so keep the already-loaded media unless the
+        # file changed on disk since
+        if st is None:
+            try:
+                st = os.stat(path)
+            except OSError:
+                st = None
+        key = (path, st.st_mtime_ns, st.st_size) if st is not None else None
+        if key is not None and self._preview_cache and self._preview_cache[0] == key:
+            return
+        content = QMediaContent(QUrl.fromLocalFile(path))
+        self._preview_cache = (key, content) if key is not None else None
+        self.video_player.setMedia(content)
         self.video_player.pause()
 
     def _on_video_error(self, error):
         """Warn the user when Windows cannot decode the preview video."""
         if error == QMediaPlayer.NoError:
             return
+        # A failed load must be retried the next time the same file is picked
+        self._preview_cache = None
         QMessageBox.warning(
             self,
             "Video Preview Error",
@@ -916,6 +1395,10 @@ class HeliCALQt(QMainWindow):
         )
 
 
+    def _on_upload_progress(self, percent: int):
+        """Show SFTP upload progress in the status bar."""
+        self.statusBar().showMessage(f"Uploading ... {percent}%", 2000)
+
     def _on_remote_file_uploaded(self, remote_path: str):
         """Start projector playback after the upload succeeds."""
         self.current_video_remote_path = remote_path
@@ -934,46 +1417,55 @@ class HeliCALQt(QMainWindow):
                 "If the login screen is active, the video cannot appear.",
             )
             self._video_login_prompted = True
-        self._append_log("[VIDEO] Checking remote display availability ...")
-        commands = [
-            "bash -lc 'if DISPLAY=:0 xset q >/dev/null 2>&1; "
-            "then echo \"[VIDEO] Display ready\"; else echo \"[VIDEO] Display locked. Log into the Jetson desktop.\"; fi'",
-            "bash -lc 'pkill mpv >/dev/null 2>&1 || true'",
-            (
-                "bash -lc 'DISPLAY=:0 nohup mpv --vo=gpu --hwdec=auto --title=ProjectorVideo "
-                "--keep-open --fullscreen --loop=inf --no-terminal --video-rotate=180 "
-                f"{shlex.quote(remote_path)} >/tmp/mpv.log 2>&1 & sleep 0.5'"
-            ),
-            "bash -lc 'DISPLAY=:0 xdotool search --name ProjectorVideo windowmove 1920 0 || true'",
-            "bash -lc 'DISPLAY=:0 xdotool search --name ProjectorVideo windowsize 2560 1600 || true'",
-            "bash -lc \"DISPLAY=:0 xdotool search --name ProjectorVideo windowactivate --sync key space || true\"",
+        script = self._VIDEO_CMD_TEMPLATE.format(path=shlex.quote(remote_path))
+        if not self._display_ok:
+            # Probe until the Jetson has reported a usable display once this session
+            self._append_log("[VIDEO] Checking remote display availability ...")
+            script = f"{self._VIDEO_DISPLAY_PROBE}; {script}"
+        self._ssh_worker.enqueue_shell(f"bash -lc {shlex.quote(script)}", False)
+
+    def _bind_cfg_widgets(self):
+        """Seed the config cache from the parameter widgets and keep it in sync via their change signals."""
+        self._cfg_cache = {}
+        job_plan = {}
+        bindings = [
+            (self._cfg_cache, "resolution", self.sb_res, int),
+            (self._cfg_cache, "num_angles", self.sb_ang, int),
+            (self._cfg_cache, "proj_threshold", self.dsb_thr, float),
+            (self._cfg_cache, "pixel_size_mm", self.dsb_px, float),
+            (self._cfg_cache, "feedrate", self.sb_fr, int),
+            (self._cfg_cache, "laser_power_on", self.sb_on, int),
+            (self._cfg_cache, "laser_power_off", self.sb_off, int),
+            (self._cfg_cache, "dwell_ms", self.sb_dw, int),
+            (self._cfg_cache, "ray_type", self.cb_ray, str),
+            (job_plan, "start_r", self.dsb_job_r, float),
+            (job_plan, "start_t", self.dsb_job_t, float),
+            (job_plan, "start_z", self.dsb_job_z, float),
+            (job_plan, "a_rpm", self.sb_job_rpm, int),
+            (job_plan, "warmup_ms", self.sb_job_warmup, int),
+            (job_plan, "include_video", self.cb_job_video, bool),
+            (job_plan, "include_metrology_wait", self.cb_job_metrology, bool),
+            (job_plan, "max_layers", self.sb_job_layers, int),
         ]
-        for cmd in commands:
-            self._ssh_worker.enqueue_shell(cmd, False)
+        self._cfg_cache["job_plan"] = job_plan
+        for target, key, widget, cast in bindings:
+            if isinstance(widget, QCheckBox):
+                signal, current = widget.toggled, widget.isChecked()
+            elif isinstance(widget, QComboBox):
+                signal, current = widget.currentTextChanged, widget.currentText()
+            else:
+                signal, current = widget.valueChanged, widget.value()
+            target[key] = cast(current)
+            signal.connect(partial(self._set_cfg_value, target, key, cast))
+
+    @staticmethod
+    def _set_cfg_value(target, key, cast, value):
+        target[key] = cast(value)
 
     def _cfg_from_ui(self):
-        """Convert the GUI widgets into the dictionary structure consumed by the pipeline."""
-        cfg = {
-            "resolution": int(self.sb_res.value()),
-            "num_angles": int(self.sb_ang.value()),
-            "proj_threshold": float(self.dsb_thr.value()),
-            "pixel_size_mm": float(self.dsb_px.value()),
-            "feedrate": int(self.sb_fr.value()),
-            "laser_power_on": int(self.sb_on.value()),
-            "laser_power_off": int(self.sb_off.value()),
-            "dwell_ms": int(self.sb_dw.value()),
-            "ray_type": self.cb_ray.currentText(),
-        }
-        cfg["job_plan"] = {
-            "start_r": float(self.dsb_job_r.value()),
-            "start_t": float(self.dsb_job_t.value()),
-            "start_z": float(self.dsb_job_z.value()),
-            "a_rpm": int(self.sb_job_rpm.value()),
-            "warmup_ms": int(self.sb_job_warmup.value()),
-            "include_video": bool(self.cb_job_video.isChecked()),
-            "include_metrology_wait": bool(self.cb_job_metrology.isChecked()),
-            "max_layers": int(self.sb_job_layers.value()),
-        }
+        """Return a copy of the config shown in the GUI, in the structure consumed by the pipeline."""
+        cfg = dict(self._cfg_cache)
+        cfg["job_plan"] = dict(cfg["job_plan"])
         return cfg
 
     def _run_pipeline_clicked(self):
@@ -983,37 +1475,45 @@ class HeliCALQt(QMainWindow):
             return
         stl = self.le_stl.text().strip()
         out_dir = self.le_out.text().strip()
-        os.makedirs(out_dir, exist_ok=True)
         cfg = self._cfg_from_ui()
         _save_cfg(cfg)
 
-        if getattr(self, "_thread", None):
-            try:
-                self._thread.quit()
-                self._thread.wait(100)
-            except Exception:
-                pass
+        if self._thread is None:
+            self._start_pipeline_thread()
+        # One run at a time; the button comes back when the worker reports done/failed
+        self.btn_run.setEnabled(False)
+        self.pipeline_requested.emit(stl, out_dir, cfg, self.cb_demo.isChecked())
 
+    def _start_pipeline_thread(self):
+        """Create the pipeline worker and its thread once; later runs are handed over via pipeline_requested."""
         self._thread = QThread()
-        self._worker = PipelineWorker(stl, out_dir, cfg, self.cb_demo.isChecked())
+        self._worker = PipelineWorker(executor=self._pipeline_executor())
         self._worker.moveToThread(self._thread)
-        self._thread.started.connect(self._worker.run)
         self._worker.log.connect(self._append_log)
         self._worker.done.connect(self._on_pipeline_done)
         self._worker.failed.connect(self._on_pipeline_failed)
-        self._worker.done.connect(self._thread.quit)
-        self._worker.failed.connect(self._thread.quit)
-        self._thread.finished.connect(self._thread.deleteLater)
+        self.pipeline_requested.connect(self._worker.start)
         self._thread.start()
 
+    def _pipeline_executor(self):
+        """Single-worker process pool for the CPU-heavy pipeline steps, created on first run."""
+        if self._pipeline_pool is None:
+            # spawn, not fork: forking a process that owns Qt and SSH threads is unsafe. Children that
+            # already exist are noted so _stop_pipeline_pool only kills the pool's own workers.
+            self._pool_foreign_children = set(multiprocessing.active_children())
+            self._pipeline_pool = ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn"))
+        return self._pipeline_pool
+
     def _on_pipeline_done(self, out_dir: str):
         """Celebrate a completed pipeline run with a message box."""
+        self.btn_run.setEnabled(True)
         if getattr(self, "_worker", None):
             self.last_job_plan_path = getattr(self._worker, "job_plan_path", "") or ""
         QMessageBox.information(self, "Done", f"Outputs saved to:\n{out_dir}")
 
     def _on_pipeline_failed(self, err: str):
         """Surface worker exceptions to the user in a blocking dialog."""
+        self.btn_run.setEnabled(True)
         QMessageBox.critical(self, "Pipeline Error", err)
 
     def _build_tab_steppers(self):
@@ -1193,23 +1693,25 @@ class HeliCALQt(QMainWindow):
         jog_layout = QGridLayout()
         self.le_jog_step = QDoubleSpinBox(); self.le_jog_step.setDecimals(3); self.le_jog_step.setRange(0.001, 10000.0); self.le_jog_step.setValue(1.0); self.le_jog_step.setSuffix(" mm")
         self.le_jog_feed = QDoubleSpinBox(); self.le_jog_feed.setDecimals(1); self.le_jog_feed.setRange(0.1, 100000.0); self.le_jog_feed.setValue(50.0); self.le_jog_feed.setSuffix(" mm/s")
+        self.le_jog_feed.valueChanged.connect(self._update_jog_feed_suffix)
+        self._update_jog_feed_suffix(self.le_jog_feed.value())
         jog_layout.addWidget(QLabel("Step Size:"), 0, 0)
         jog_layout.addWidget(self.le_jog_step, 0, 1)
         jog_layout.addWidget(QLabel("Jog Speed:"), 0, 2)
         jog_layout.addWidget(self.le_jog_feed, 0, 3)
 
         btn_r_minus = QPushButton("-R")
-        btn_r_minus.clicked.connect(lambda: self._send_jog("R", -1))
+        btn_r_minus.clicked.connect(partial(self._send_jog, "R", -1))
         btn_r_plus = QPushButton("+R")
-        btn_r_plus.clicked.connect(lambda: self._send_jog("R", 1))
+        btn_r_plus.clicked.connect(partial(self._send_jog, "R", 1))
         btn_t_minus = QPushButton("-T")
-        btn_t_minus.clicked.connect(lambda: self._send_jog("T", -1))
+        btn_t_minus.clicked.connect(partial(self._send_jog, "T", -1))
         btn_t_plus = QPushButton("+T")
-        btn_t_plus.clicked.connect(lambda: self._send_jog("T", 1))
+        btn_t_plus.clicked.connect(partial(self._send_jog, "T", 1))
         btn_z_minus = QPushButton("-Z")
-        btn_z_minus.clicked.connect(lambda: self._send_jog("Z", -1))
+        btn_z_minus.clicked.connect(partial(self._send_jog, "Z", -1))
         btn_z_plus = QPushButton("+Z")
-        btn_z_plus.clicked.connect(lambda: self._send_jog("Z", 1))
+        btn_z_plus.clicked.connect(partial(self._send_jog, "Z", 1))
 
         jog_layout.addWidget(btn_r_minus, 1, 0)
         jog_layout.addWidget(btn_r_plus, 1, 1)
@@ -1221,8 +1723,10 @@ class HeliCALQt(QMainWindow):
         jog_group.setLayout(jog_layout)
         layout.addWidget(jog_group)
 
-        self.txt_gcode_log = QTextEdit()
+        # Plain-text document capped to the newest lines, so long master_queue sessions stay cheap
+        self.txt_gcode_log = QPlainTextEdit()
         self.txt_gcode_log.setReadOnly(True)
+        self.txt_gcode_log.setMaximumBlockCount(5000)
         log_header = QHBoxLayout()
         log_header.addWidget(QLabel("G-code Console"))
         btn_save_log = QPushButton("Save Output")
@@ -1246,8 +1750,9 @@ class HeliCALQt(QMainWindow):
         tab = QWidget()
         layout = QVBoxLayout(tab)
         self.video_player = QMediaPlayer(self)
-        self.video_widget = QVideoWidget()
-        self.video_player.setVideoOutput(self.video_widget)
+        self._preview_cache = None
+        self.video_widget = VideoPreviewView()
+        self.video_player.setVideoOutput(self.video_widget.video_item)
         self.video_player.error.connect(self._on_video_error)
         layout.addWidget(self.video_widget, 1)
         controls = QHBoxLayout()
@@ -1263,7 +1768,7 @@ class HeliCALQt(QMainWindow):
     def _append_gcode_log(self, msg: str):
         """Append messages to the dedicated G-code console."""
         if hasattr(self, "txt_gcode_log") and self.txt_gcode_log:
-            self.txt_gcode_log.append(msg)
+            self.txt_gcode_log.appendPlainText(msg)
 
     def _ensure_remote_ready(self) -> bool:
         """Confirm that SSH is connected before sending potentially dangerous commands."""
@@ -1285,6 +1790,19 @@ class HeliCALQt(QMainWindow):
         except Exception as exc:
             self._append_gcode_log(f"[LOCAL] Failed to queue command: {exc}")
 
+    def _send_gcode_commands(self, commands):
+        """Queue several commands as one newline-joined block so they reach master_queue in one write."""
+        commands = [cmd.strip() for cmd in commands if cmd and cmd.strip()]
+        if not commands:
+            return
+        if not self._ensure_remote_ready():
+            return
+        self._append_gcode_log("\n".join(f"> {cmd}" for cmd in commands))
+        try:
+            self._ssh_worker.enqueue_command("\n".join(commands))
+        except Exception as exc:
+            self._append_gcode_log(f"[LOCAL] Failed to queue command: {exc}")
+
     def _collect_feedrates(self):
         """Gather any optional per-axis feedrates entered in the G1 section."""
         parts = []
@@ -1334,6 +1852,7 @@ class HeliCALQt(QMainWindow):
             "Save G-code Output",
             str(default_path),
             "Text Files (*.txt);;All Files (*.*)",
+            options=self.FILE_DIALOG_OPTIONS,
         )
         if not fname:
             return
@@ -1343,23 +1862,23 @@ class HeliCALQt(QMainWindow):
         except Exception as exc:
             QMessageBox.critical(self, "Save Failed", f"Could not save log: {exc}")
 
-    def _send_jog(self, axis: str, direction: int):
-        """Issue a jog sequence (relative move followed by absolute restore) using the spin boxes."""
+    def _send_jog(self, axis: str, direction: int, checked: bool = False):
+        """Issue a jog sequence (relative move followed by absolute restore) using the spin boxes.
+
+        `checked` absorbs the clicked(bool) argument so the partial-bound buttons connect directly.
+        """
         if not self._ensure_remote_ready():
             return
         step = float(self.le_jog_step.value()) if self.le_jog_step else 0.0
-        feed = float(self.le_jog_feed.value()) if self.le_jog_feed else 0.0
-        if step <= 0 or feed <= 0:
+        if step <= 0 or not self._jog_feed_suffix:
             QMessageBox.warning(self, "Jog", "Set a positive step size and jog speed.")
             return
         delta = step * direction
-        commands = [
-            "G91",
-            f"G1 {axis}{delta} F{feed}",
-            "G90",
-        ]
-        for cmd in commands:
-            self._send_gcode_command(cmd)
+        self._send_gcode_commands(["G91", f"G1 {axis}{delta} {self._jog_feed_suffix}", "G90"])
+
+    def _update_jog_feed_suffix(self, value: float):
+        """Cache the F word for jogs whenever the jog speed changes (empty while not positive)."""
+        self._jog_feed_suffix = f"F{float(value)}" if value > 0 else ""
 
     def _send_led_current(self):
         """Send the M205 command that adjusts LED current on the Jetson."""
@@ -1390,14 +1909,11 @@ class HeliCALQt(QMainWindow):
             "G33 A9",
             "G5",
         ]
-        for cmd in commands:
-            self._send_gcode_command(cmd)
+        self._send_gcode_commands(commands)
 
     def _send_end_sequence(self):
         """Send the standard shutdown script that stops motion and powers off motors."""
-        commands = ["G33 A0", "G28", "M18 R T"]
-        for cmd in commands:
-            self._send_gcode_command(cmd)
+        self._send_gcode_commands(["G33 A0", "G28", "M18 R T"])
 
     def _send_job_plan(self):
         """Stream the generated job-plan G-code file to the Jetson."""
@@ -1458,8 +1974,32 @@ class HeliCALQt(QMainWindow):
     def closeEvent(self, event):
         """Ensure background workers are stopped when the window closes."""
         self._shutdown_ssh_worker()
+        self._preview_cache = None
+        if self._thread is not None:
+            # Abandon any in-flight run, then join without a timeout: destroying a QThread that is
+            # still running aborts the whole process.
+            if self._worker is not None:
+                self._worker.cancel()
+            self._stop_pipeline_pool()
+            self._thread.quit()
+            self._thread.wait()
+            self._thread = None
+            self._worker = None
+        self._stop_pipeline_pool()
         super().closeEvent(event)
 
+    def _stop_pipeline_pool(self):
+        """Shut the process pool down, killing a projection that is still running in it."""
+        pool, self._pipeline_pool = self._pipeline_pool, None
+        if pool is None:
+            return
+        # shutdown() only cancels queued jobs; the pool's workers are the multiprocessing children
+        # started since it was created, so terminate those to stop a projection mid-run
+        workers = set(multiprocessing.active_children()) - self._pool_foreign_children
+        pool.shutdown(wait=False, cancel_futures=True)
+        for proc in workers:
+            proc.terminate()
+
 
 def main():
     """Entry point for local testing so `python gui_test.py` brings up the GUI."""
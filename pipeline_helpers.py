@@ -151,11 +151,29 @@ def run_projection(tg: 'TargetGeometry', num_angles: int, ray_type: str) -> tupl
     return recon_array, sino, recon
 
 
-def save_projection_images(output_dir: str, sino: 'Sinogram', recon_array: np.ndarray):
-    """Persist PNGs that visualize the sinogram and a central reconstruction slice."""
-    os.makedirs(output_dir, exist_ok=True)
-    # --- Sinogram preview (always 2D) ---
-    sino_img = _sino_preview_2d(sino.array)
+def voxelize_and_project(stl_path: str, resolution: int, num_angles: int, ray_type: str) -> tuple[np.ndarray, 'Sinogram', 'Reconstruction']:
+    """voxelize_stl + run_projection in one picklable call, so a worker process can run both."""
+    tg = voxelize_stl(stl_path, resolution)
+    return run_projection(tg, num_angles, ray_type)
+
+
+def _angle_strips(data: np.ndarray) -> Optional[np.ndarray]:
+    """Return an (angles, detector) view of the sinogram's central detector row, or None."""
+    if data.ndim == 2:
+        # (angles, det) or (det, angles)
+        return data if data.shape[0] >= data.shape[1] else data.T
+    if data.ndim == 3:
+        angles_axis = int(np.argmax(data.shape))
+        if angles_axis != 0:
+            data = np.moveaxis(data, angles_axis, 0)  # (angles, det_u, det_v)
+        return data[:, :, data.shape[2] // 2]
+    data = np.squeeze(data)
+    if data.ndim == 2:
+        return _angle_strips(data)
+    return None
+
+
+def _save_sino_preview(output_dir: str, sino_img: np.ndarray) -> str:
     plt.figure()
     plt.imshow(sino_img, cmap="gray", origin="lower", aspect="auto")
     plt.title("Sinogram (preview)")
@@ -164,8 +182,10 @@ def save_projection_images(output_dir: str, sino: 'Sinogram', recon_array: np.nd
     plt.savefig(sino_path, bbox_inches="tight", dpi=220)
     plt.close()
     log(f"Saved {sino_path}")
+    return sino_path
+
 
-    # --- Reconstruction central slice (2D) ---
+def _save_recon_slice(output_dir: str, recon_array: np.ndarray) -> str:
     rec = np.asarray(recon_array)
     if rec.ndim >= 3:
         mid = rec.shape[2] // 2
@@ -184,49 +204,20 @@ def save_projection_images(output_dir: str, sino: 'Sinogram', recon_array: np.nd
     plt.savefig(recon_path, bbox_inches="tight", dpi=220)
     plt.close()
     log(f"Saved {recon_path}")
+    return recon_path
 
-    return sino_path, recon_path
-
-
-def save_angle_montage(output_dir: str, sino: 'Sinogram', n_cols: int = 10) -> str:
-    """Build a tiled PNG that samples the projection angles so demo users see motion."""
-    os.makedirs(output_dir, exist_ok=True)
-    data = np.asarray(sino.array)
 
-    # Ensure angles is axis 0
-    if data.ndim == 2:
-        # (angles, det) or (det, angles)
-        if data.shape[0] >= data.shape[1]:
-            angles_first = data
-        else:
-            angles_first = data.T
-        frames = [angles_first[i:i+1, :] for i in range(angles_first.shape[0])]
-        # Turn each row into a thin image
-        frames = [np.repeat(f, repeats=8, axis=0) for f in frames]  # make it more visible
-    elif data.ndim == 3:
-        # Move angles to axis 0
-        angles_axis = int(np.argmax(data.shape))
-        if angles_axis != 0:
-            data = np.moveaxis(data, angles_axis, 0)  # (angles, det_u, det_v)
-        A, U, V = data.shape
-        mid_v = V // 2
-        frames = [data[i, :, mid_v] for i in range(A)]  # each is (det_u,)
-        # Expand to 2D small strips for display
-        frames = [np.repeat(f[np.newaxis, :], repeats=8, axis=0) for f in frames]
-    else:
-        data = np.squeeze(data)
-        if data.ndim == 2:
-            return save_angle_montage(output_dir, Sinogram(data, sino.proj_geo), n_cols=n_cols)
+def _save_montage(output_dir: str, strips: Optional[np.ndarray], n_cols: int) -> Optional[str]:
+    if strips is None:
         # give up gracefully
         log("[WARN] Could not generate montage: unexpected sinogram shape.")
-        return
-
-    # Pick up to 20 frames evenly
-    n = len(frames)
+        return None
+    n = strips.shape[0]
     if n == 0:
         log("[WARN] Empty sinogram; skipping montage.")
-        return
+        return None
     import math
+    # Pick up to 20 frames evenly; only those rows are expanded into visible strips
     take = min(n, 20)
     idxs = np.linspace(0, n - 1, take, dtype=int)
 
@@ -236,7 +227,8 @@ def save_angle_montage(output_dir: str, sino: 'Sinogram', n_cols: int = 10) -> s
     for k, ax in enumerate(axes.ravel()):
         ax.axis("off")
         if k < take:
-            ax.imshow(frames[idxs[k]], cmap="gray", origin="lower", aspect="auto")
+            strip = np.repeat(strips[idxs[k]][np.newaxis, :], repeats=8, axis=0)  # make it more visible
+            ax.imshow(strip, cmap="gray", origin="lower", aspect="auto")
             ax.set_title(f"θ {idxs[k]}")
     fig.suptitle("Angle Sweep Montage", fontsize=12)
     fig.tight_layout()
@@ -247,6 +239,36 @@ def save_angle_montage(output_dir: str, sino: 'Sinogram', n_cols: int = 10) -> s
     return out
 
 
+def save_projection_images(output_dir: str, sino: 'Sinogram', recon_array: np.ndarray):
+    """Persist PNGs that visualize the sinogram and a central reconstruction slice."""
+    os.makedirs(output_dir, exist_ok=True)
+    sino_path = _save_sino_preview(output_dir, _sino_preview_2d(sino.array))
+    recon_path = _save_recon_slice(output_dir, recon_array)
+    return sino_path, recon_path
+
+
+def save_angle_montage(output_dir: str, sino: 'Sinogram', n_cols: int = 10) -> str:
+    """Build a tiled PNG that samples the projection angles so demo users see motion."""
+    os.makedirs(output_dir, exist_ok=True)
+    return _save_montage(output_dir, _angle_strips(np.asarray(sino.array)), n_cols)
+
+
+def save_all_from_sino(output_dir: str, sino: 'Sinogram', recon_array: np.ndarray, n_cols: int = 10):
+    """Write the sinogram preview, reconstruction slice, montage, and MP4 from one view of ``sino``.
+
+    The sinogram is materialized and re-oriented once; the preview and montage are both views
+    into that array, so the projection data is not re-walked per artifact.
+    Returns ``(sino_path, recon_path, montage_path, video_path)``.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    data = np.asarray(sino.array)
+    sino_path = _save_sino_preview(output_dir, _sino_preview_2d(data))
+    recon_path = _save_recon_slice(output_dir, recon_array)
+    montage_path = _save_montage(output_dir, _angle_strips(data), n_cols)
+    video_path = save_reconstruction_video(output_dir, sino)
+    return sino_path, recon_path, montage_path, video_path
+
+
 def gcode_from_slice(img: np.ndarray, cfg: dict) -> str:
     """Scanline the boolean-ish slice into serpentine toolpaths and return a textual program."""
     thr = float(cfg["proj_threshold"])  # 0..1
@@ -1,6 +1,12 @@
+import concurrent.futures
+import concurrent.futures.process
 import sys
+import threading
+import time
 import types
 import shlex
+import socket
+import subprocess
 from pathlib import Path
 
 import numpy as np
@@ -178,6 +184,50 @@ def test_cfg_from_ui_reflects_widget_values(gui):
     assert cfg["dwell_ms"] == 10
 
 
+def test_cfg_from_ui_tracks_job_plan_widgets_and_returns_copies(gui):
+    """Checkbox/combobox edits land in the cached config; callers can't mutate the cache."""
+    gui.cb_job_video.setChecked(False)
+    gui.sb_job_layers.setValue(7)
+    cfg = gui._cfg_from_ui()
+    assert cfg["job_plan"]["include_video"] is False
+    assert cfg["job_plan"]["max_layers"] == 7
+    assert cfg["ray_type"] == gui.cb_ray.currentText()
+    cfg["job_plan"]["max_layers"] = 99
+    cfg["resolution"] = 1
+    again = gui._cfg_from_ui()
+    assert again["job_plan"]["max_layers"] == 7
+    assert again["resolution"] == gui.sb_res.value()
+
+
+def test_default_cfg_loads_once_and_returns_copies(monkeypatch):
+    """Config parsing is cached; each caller still gets its own mutable copy."""
+    calls = []
+
+    class _Helpers:
+        @staticmethod
+        def load_config():
+            calls.append(1)
+            return {"resolution": 64}
+
+        @staticmethod
+        def save_config(cfg):
+            pass
+
+    monkeypatch.setattr(gui_test, "pipeline", _Helpers)
+    gui_test._load_default_cfg.cache_clear()
+    try:
+        first = gui_test._default_cfg()
+        first["resolution"] = 1
+        second = gui_test._default_cfg()
+        assert second["resolution"] == 64
+        assert len(calls) == 1
+        gui_test._save_cfg(second)
+        gui_test._default_cfg()
+        assert len(calls) == 2
+    finally:
+        gui_test._load_default_cfg.cache_clear()
+
+
 def test_save_cfg_clicked_persists_cfg_and_notifies(gui, monkeypatch, dialog_spy):
     """Verify that clicking save passes data to _save_cfg and shows a dialog."""
     captured = {}
@@ -214,34 +264,119 @@ def test_show_connection_failed_message_prompts_user(gui, dialog_spy):
     assert dialog_spy["critical"]
 
 
-def test_probe_ssh_host_success(gui, monkeypatch):
-    """A reachable Jetson should cause _probe_ssh_host to return True."""
-    class DummyConn:
-        def __enter__(self):
-            return self
+def _wait_for_probe(gui, qt_app):
+    results = []
+    gui._probe_ssh_host(results.append)
+    deadline = time.monotonic() + 5
+    while not results and time.monotonic() < deadline:
+        qt_app.processEvents()
+        time.sleep(0.01)
+    return results
+
+
+def test_probe_ssh_host_success(gui, qt_app):
+    """A reachable Jetson should report True without blocking the GUI thread."""
+    server = socket.socket()
+    server.bind(("127.0.0.1", 0))
+    server.listen(1)
+    gui.ssh_host, gui.ssh_port = server.getsockname()
+    try:
+        assert _wait_for_probe(gui, qt_app) == [True]
+        assert not gui._probe_pending
+    finally:
+        server.close()
+
+
+def test_probe_ssh_host_failure_logs(gui, qt_app):
+    """A refused connection should be logged and reported as False."""
+    closed = socket.socket()
+    closed.bind(("127.0.0.1", 0))
+    gui.ssh_host, gui.ssh_port = closed.getsockname()
+    closed.close()
+    assert _wait_for_probe(gui, qt_app) == [False]
+    assert "[SSH] Probe error" in gui.txt_log.toPlainText()
 
-        def __exit__(self, *exc):
-            return False
 
-    captured = {}
+def test_run_pipeline_clicked_reuses_one_worker_thread(gui, monkeypatch, dialog_spy, tmp_path):
+    """Repeated runs are handed to a single long-lived worker thread instead of a new QThread each."""
+    monkeypatch.setattr(gui_test, "PIPELINE_OK", True)
+    monkeypatch.setattr(gui_test, "_save_cfg", lambda cfg: None)
+    threads = []
 
-    def fake_conn(addr, timeout=0):
-        captured["addr"] = addr
-        return DummyConn()
+    def _fake_start():
+        threads.append(types.SimpleNamespace(quit=lambda: None, wait=lambda *a: True))
+        gui._thread = threads[-1]
 
-    monkeypatch.setattr(gui_test.socket, "create_connection", fake_conn)
-    assert gui._probe_ssh_host()
-    assert captured["addr"] == (gui.ssh_host, 22)
+    monkeypatch.setattr(gui, "_start_pipeline_thread", _fake_start)
+    runs = []
+    gui.pipeline_requested.connect(lambda *args: runs.append(args))
+    gui.le_out.setText(str(tmp_path))
+    gui._run_pipeline_clicked()
+    assert not gui.btn_run.isEnabled()
+    gui._on_pipeline_failed("boom")
+    assert gui.btn_run.isEnabled()
+    gui._run_pipeline_clicked()
+    assert len(threads) == 1
+    assert [run[1] for run in runs] == [str(tmp_path), str(tmp_path)]
 
 
-def test_probe_ssh_host_failure_logs(gui, monkeypatch):
-    """Socket errors should be logged and the method should return False."""
-    def fake_conn(*args, **kwargs):
-        raise OSError("boom")
+def test_close_during_pipeline_run_joins_worker_thread(gui, monkeypatch, tmp_path):
+    """Closing mid-run abandons the projection job and joins the worker thread before returning."""
+    pending = concurrent.futures.Future()
+    submitted = threading.Event()
 
-    monkeypatch.setattr(gui_test.socket, "create_connection", fake_conn)
-    assert not gui._probe_ssh_host()
-    assert "[SSH] Probe error" in gui.txt_log.toPlainText()
+    class _Executor:
+        def submit(self, fn, *args):
+            submitted.set()
+            return pending
+
+    ns = types.SimpleNamespace(resolve_stl_path=lambda stl, demo: "resolved.stl", voxelize_and_project=None)
+    monkeypatch.setattr(gui_test, "pipeline", ns)
+    monkeypatch.setattr(gui_test, "PIPELINE_OK", True)
+    monkeypatch.setattr(gui_test, "_save_cfg", lambda cfg: None)
+    monkeypatch.setattr(gui, "_pipeline_executor", lambda: _Executor())
+    gui.le_out.setText(str(tmp_path))
+    gui._run_pipeline_clicked()
+    thread = gui._thread
+    assert submitted.wait(5)
+    assert thread.isRunning()
+    gui.close()
+    assert thread.isFinished()
+    assert gui._thread is None
+    assert pending.cancelled()
+
+
+def test_close_while_pool_is_killed_does_not_report_failure(gui, monkeypatch, dialog_spy, tmp_path):
+    """Killing the pool on close breaks the running job; that must not surface as a pipeline error."""
+    pending = concurrent.futures.Future()
+    pending.set_running_or_notify_cancel()  # already running in the child, so cancel() can't stop it
+    submitted = threading.Event()
+
+    class _Executor:
+        def submit(self, fn, *args):
+            submitted.set()
+            return pending
+
+    def _kill_pool():
+        if not pending.done():
+            pending.set_exception(concurrent.futures.process.BrokenProcessPool("worker killed"))
+
+    ns = types.SimpleNamespace(resolve_stl_path=lambda stl, demo: "resolved.stl", voxelize_and_project=None)
+    monkeypatch.setattr(gui_test, "pipeline", ns)
+    monkeypatch.setattr(gui_test, "PIPELINE_OK", True)
+    monkeypatch.setattr(gui_test, "_save_cfg", lambda cfg: None)
+    monkeypatch.setattr(gui, "_pipeline_executor", lambda: _Executor())
+    monkeypatch.setattr(gui, "_stop_pipeline_pool", _kill_pool)
+    gui.le_out.setText(str(tmp_path))
+    failures = []
+    gui._run_pipeline_clicked()
+    gui._worker.failed.connect(failures.append, gui_test.Qt.DirectConnection)
+    assert submitted.wait(5)
+    gui.close()
+    QApplication.processEvents()
+    assert failures == []
+    assert dialog_spy["critical"] == []
+    assert "Run cancelled" in gui.txt_log.toPlainText()
 
 
 def test_prompt_remote_password_launches_worker(gui, monkeypatch):
@@ -438,10 +573,10 @@ def test_send_custom_command_clears_field(gui):
 
 
 def test_save_gcode_log_writes_text(gui, tmp_path, monkeypatch):
-    """Saving the log should write the QTextEdit contents to the chosen path."""
+    """Saving the log should write the console contents to the chosen path."""
     target = tmp_path / "gcode.txt"
     monkeypatch.setattr(gui_test.QFileDialog, "getSaveFileName", lambda *a, **k: (str(target), "txt"))
-    gui.txt_gcode_log.setText("hello log")
+    gui.txt_gcode_log.setPlainText("hello log")
     gui._save_gcode_log()
     assert target.read_text(encoding="utf-8") == "hello log"
 
@@ -455,13 +590,11 @@ def test_send_jog_requires_positive_values(gui, dialog_spy, monkeypatch):
 
 
 def test_send_jog_emits_relative_sequence(gui):
-    """A successful jog should emit the expected G91/G1/G90 trio."""
-    sent = []
-    gui._send_gcode_command = sent.append
+    """A successful jog should queue the G91/G1/G90 trio as one block."""
     gui.le_jog_step.setValue(2.0)
     gui.le_jog_feed.setValue(50.0)
     gui._send_jog("Z", 1)
-    assert sent == ["G91", "G1 Z2.0 F50.0", "G90"]
+    assert gui._ssh_worker.commands[-1] == "G91\nG1 Z2.0 F50.0\nG90"
 
 
 def test_send_start_sequence_requires_values(gui, dialog_spy):
@@ -475,21 +608,20 @@ def test_send_start_sequence_requires_values(gui, dialog_spy):
 
 def test_send_start_sequence_runs_full_flow(gui):
     """When values exist the macro should send the hard-coded sequence including the G0 line."""
-    sent = []
-    gui._send_gcode_command = sent.append
     gui.le_g0_r.setText("1")
     gui.le_g0_t.setText("2")
     gui.le_g0_z.setText("3")
+    gui._ssh_worker.commands.clear()
     gui._send_start_sequence()
-    assert sent == ["M17", "G28", "G0 R1 T2 Z3", "G92", "G33 A9", "G5"]
+    assert gui._ssh_worker.commands == ["M17\nG28\nG0 R1 T2 Z3\nG92\nG33 A9\nG5"]
+    assert "> G0 R1 T2 Z3" in gui.txt_gcode_log.toPlainText()
 
 
 def test_send_end_sequence_stops_machine(gui):
     """The end macro should always issue the stop commands in order."""
-    sent = []
-    gui._send_gcode_command = sent.append
+    gui._ssh_worker.commands.clear()
     gui._send_end_sequence()
-    assert sent == ["G33 A0", "G28", "M18 R T"]
+    assert gui._ssh_worker.commands == ["G33 A0\nG28\nM18 R T"]
 
 
 def test_send_led_current_uses_spinbox_value(gui):
@@ -531,25 +663,136 @@ def test_upload_video_clicked_rejects_non_mp4(gui, tmp_path, dialog_spy):
     assert gui._ssh_worker.uploads == []
 
 
+def test_file_dialogs_request_cheap_native_options(gui, monkeypatch):
+    """Every picker should skip custom icons and symlink resolution and stay native."""
+    seen = []
+
+    def _record(*args, **kwargs):
+        seen.append(kwargs.get("options"))
+        return ("", "")
+
+    monkeypatch.setattr(gui_test.QFileDialog, "getOpenFileName", _record)
+    monkeypatch.setattr(gui_test.QFileDialog, "getExistingDirectory", lambda *a, **k: _record(*a, **k)[0])
+    gui._browse_stl()
+    gui._browse_video()
+    gui._browse_outdir()
+    assert len(seen) == 3
+    for options in seen:
+        assert options & gui_test.QFileDialog.DontResolveSymlinks
+        assert options & gui_test.QFileDialog.DontUseCustomDirectoryIcons
+        assert not options & gui_test.QFileDialog.DontUseNativeDialog
+
+
+def test_upload_video_clicked_rejects_directories(gui, tmp_path, dialog_spy):
+    """A folder that merely ends in .mp4 is not an uploadable file."""
+    folder = tmp_path / "renders.mp4"
+    folder.mkdir()
+    gui.le_video.setText(str(folder))
+    gui._upload_video_clicked()
+    assert any("does not exist" in msg["text"] for msg in dialog_spy["warning"])
+    assert gui._ssh_worker.uploads == []
+
+
+def test_upload_video_clicked_stats_the_file_once(gui, monkeypatch, tmp_path):
+    """The upload check and the preview cache should share a single stat of the video."""
+    video = tmp_path / "projector.mp4"
+    video.write_text("stub", encoding="utf-8")
+    gui.le_video.setText(str(video))
+    gui._preview_cache = None
+    calls = []
+    real_stat = gui_test.os.stat
+
+    def _counting_stat(path, *args, **kwargs):
+        if str(path) == str(video):
+            calls.append(path)
+        return real_stat(path, *args, **kwargs)
+
+    monkeypatch.setattr(gui_test.os, "stat", _counting_stat)
+    gui._upload_video_clicked()
+    assert len(calls) == 1
+    assert gui._preview_cache[0][0] == str(video)
+
+
 def test_on_remote_file_uploaded_triggers_playback(gui):
-    """Once the remote upload finishes the GUI should queue playback shell commands."""
-    remote = "/home/jacob/Desktop/HeliCAL_Final/Videos/demo.mp4"
+    """Once the remote upload finishes the GUI should queue playback as a single shell command."""
+    remote = "/home/jacob/Desktop/HeliCAL Final/Videos/demo.mp4"
     gui._on_remote_file_uploaded(remote)
-    expected_shells = [
-        "pkill mpv || true",
-        (
-            f"DISPLAY=:0 nohup mpv --title=ProjectorVideo --pause --no-border --loop=inf "
-            f"--video-rotate=180 {shlex.quote(remote)} >/tmp/mpv.log 2>&1 &"
-        ),
-        "DISPLAY=:0 xdotool search --name ProjectorVideo windowmove 1920 0",
-        "DISPLAY=:0 xdotool search --name ProjectorVideo windowsize 2560 1600",
-        "DISPLAY=:0 xdotool search --name ProjectorVideo windowactivate --sync key f",
+    assert len(gui._ssh_worker.shells) == 1
+    cmd, needs_sudo = gui._ssh_worker.shells[0]
+    assert not needs_sudo
+    argv = shlex.split(cmd)
+    assert argv[:2] == ["bash", "-lc"]
+    script = argv[2]
+    steps = [
+        "pkill mpv",
+        "mpv --vo=gpu --hwdec=auto --title=ProjectorVideo",
+        f"{shlex.quote(remote)} >/tmp/mpv.log 2>&1 &",
+        "xdotool search --name ProjectorVideo windowmove 1920 0",
+        "xdotool search --name ProjectorVideo windowsize 2560 1600",
+        "xdotool search --name ProjectorVideo windowactivate --sync key space",
     ]
-    assert [cmd for cmd, _ in gui._ssh_worker.shells] == expected_shells
-    assert all(not needs_sudo for _, needs_sudo in gui._ssh_worker.shells)
+    positions = [script.index(step) for step in steps]
+    assert positions == sorted(positions)
+    assert "xset q" in script
     assert gui.current_video_remote_path == remote
 
 
+def test_display_probe_command_echo_does_not_mark_display_ready(gui):
+    """The worker's echo of the probe script must not count as the Jetson reporting a ready display."""
+    gui._display_ok = False
+    gui._start_remote_video("/home/jacob/Desktop/HeliCAL_Final/Videos/demo.mp4")
+    cmd, _ = gui._ssh_worker.shells[-1]
+    gui._append_connection_log(f"[SSH] [2024-01-01 00:00:00] Running: {cmd}")
+    assert gui._display_ok is False
+    script = shlex.split(cmd)[2]
+    ready = subprocess.run(["bash", "-c", script.split("; pkill")[0].replace("DISPLAY=:0 xset q", "true")],
+                           capture_output=True, text=True).stdout
+    assert ready.strip() == "[VIDEO] Display ready"
+
+
+def test_start_remote_video_skips_display_probe_once_confirmed(gui):
+    """After the Jetson reports a ready display, later playback should not re-run xset."""
+    remote = "/home/jacob/Desktop/HeliCAL_Final/Videos/demo.mp4"
+    gui._append_connection_log("[SSH] [2024-01-01 00:00:00] [VIDEO] Display ready")
+    gui._start_remote_video(remote)
+    cmd, _ = gui._ssh_worker.shells[-1]
+    assert "xset q" not in cmd
+    assert "mpv" in cmd
+    gui._reset_video_prompt()
+    gui._start_remote_video(remote)
+    assert "xset q" in gui._ssh_worker.shells[-1][0]
+
+
+def test_video_preview_source_is_loaded_once_per_path(gui, monkeypatch, tmp_path):
+    """Pointing the preview at the same unchanged file again should not reload the media."""
+    loads = []
+    monkeypatch.setattr(gui.video_player, "setMedia", loads.append)
+    clip = tmp_path / "clip.mp4"
+    clip.write_bytes(b"a")
+    gui._set_video_preview_source(str(clip))
+    gui._set_video_preview_source(str(clip))
+    assert len(loads) == 1
+    other = tmp_path / "other.mp4"
+    other.write_bytes(b"b")
+    gui._set_video_preview_source(str(other))
+    assert len(loads) == 2
+
+
+def test_video_preview_source_reloads_rewritten_or_failed_files(gui, monkeypatch, dialog_spy, tmp_path):
+    """A file rewritten on disk, or one whose previous load failed, is loaded again."""
+    loads = []
+    monkeypatch.setattr(gui.video_player, "setMedia", loads.append)
+    clip = tmp_path / "clip.mp4"
+    clip.write_bytes(b"a")
+    gui._set_video_preview_source(str(clip))
+    clip.write_bytes(b"longer")
+    gui._set_video_preview_source(str(clip))
+    assert len(loads) == 2
+    gui._on_video_error(gui_test.QMediaPlayer.FormatError)
+    gui._set_video_preview_source(str(clip))
+    assert len(loads) == 3
+
+
 def test_build_axis_command_for_sequence_handles_missing(gui):
     """The helper should return None when no axes are filled and a string otherwise."""
     gui.le_g0_r.clear()
@@ -560,14 +803,152 @@ def test_build_axis_command_for_sequence_handles_missing(gui):
 
 
 def test_append_connection_log_updates_both_logs(gui):
-    """SSH log lines should appear in both QTextEdits."""
+    """SSH log lines should appear in both log widgets."""
     gui.txt_log.clear()
     gui.txt_gcode_log.clear()
     gui._append_connection_log("[SSH] test")
+    gui._flush_log_queue()
     assert "[SSH] test" in gui.txt_log.toPlainText()
     assert "[SSH] test" in gui.txt_gcode_log.toPlainText()
 
 
+def test_connection_log_bursts_are_flushed_in_batches(gui):
+    """A burst of SSH messages is held until the flush tick and then appended as one block."""
+    gui.txt_log.clear()
+    gui._append_connection_log("[SSH] one")
+    gui._append_connection_log("[SSH] two")
+    assert gui._log_flush_timer.isActive()
+    assert gui.txt_log.toPlainText() == ""
+    gui._flush_log_queue()
+    assert gui.txt_log.toPlainText() == "[SSH] one\n[SSH] two"
+    assert not gui._log_flush_timer.isActive()
+
+
+def test_ssh_worker_enqueue_wakes_wait_loop():
+    """Queueing a command should wake the worker's select() immediately instead of waiting for a poll tick."""
+    worker = gui_test.SSHCommandWorker("host", "user", "pw", "remote")
+    worker.enqueue_command("G90")
+    start = time.monotonic()
+    worker._wait_for_activity(timeout=5.0)
+    assert time.monotonic() - start < 1.0
+    assert worker._commands.popleft() == "G90"
+
+
+def test_ssh_worker_batches_gcode_into_single_write():
+    """G-code queued between wakes should reach master_queue as one write, split around uploads."""
+    class RecordingStdin:
+        def __init__(self):
+            self.writes = []
+
+        def write(self, data):
+            self.writes.append(data)
+
+        def flush(self):
+            pass
+
+    worker = gui_test.SSHCommandWorker("host", "user", "pw", "remote")
+    worker._stdin = RecordingStdin()
+    worker._running = True
+    uploads = []
+    worker._handle_upload = lambda local, remote: uploads.append((local, remote))
+    for cmd in ("G91", "G1 X1 F100", "G90"):
+        worker.enqueue_command(cmd)
+    worker.enqueue_upload("a.mp4", "videos/a.mp4")
+    worker.enqueue_command("M3")
+    worker._drain_commands()
+    assert worker._stdin.writes == [b"G91\nG1 X1 F100\nG90\n", b"M3\n"]
+    assert uploads == [("a.mp4", "videos/a.mp4")]
+
+
+def test_ssh_worker_send_lines_prefixes_every_line_and_keeps_utf8():
+    """Multi-line blocks are logged line by line, and non-ASCII text reaches the remote unchanged."""
+    worker = gui_test.SSHCommandWorker("host", "user", "pw", "remote")
+    worker._stdin = types.SimpleNamespace(writes=[], write=lambda data: worker._stdin.writes.append(data),
+                                          flush=lambda: None)
+    emitted = []
+    worker.log.connect(emitted.append)
+    worker._send_lines(["G91\nG1 Z2.0 F50.0\nG90", "M117 Düse"])
+    logged = emitted[-1].splitlines()
+    assert [line.split("] > ", 1)[1] for line in logged] == ["G91", "G1 Z2.0 F50.0", "G90", "M117 Düse"]
+    assert all(line.startswith("[SSH] [") for line in logged)
+    assert worker._stdin.writes == ["G91\nG1 Z2.0 F50.0\nG90\nM117 Düse\n".encode("utf-8")]
+
+
+def test_ssh_worker_caps_log_block_size():
+    """A flood of remote output is split into bounded blocks without dropping any line."""
+    worker = gui_test.SSHCommandWorker("host", "user", "pw", "remote")
+    emitted = []
+    worker.log.connect(emitted.append)
+    worker._log_output(b"".join(b"error: line %d\n" % i for i in range(2000)))
+    assert len(emitted) > 1
+    assert all(len(block) <= worker.LOG_EMIT_MAX_CHARS for block in emitted)
+    lines = [line for block in emitted for line in block.splitlines()]
+    assert len(lines) == 2000
+    assert lines[0].endswith("error: line 0")
+    assert lines[-1].endswith("error: line 1999")
+
+
+def test_ssh_worker_upload_streams_file_contents(tmp_path):
+    """Uploads write the whole local file through a pipelined handle and finish at 100%."""
+    local = tmp_path / "clip.mp4"
+    payload = bytes(range(256)) * 1000
+    local.write_bytes(payload)
+
+    class _Remote:
+        def __init__(self):
+            self.data = bytearray()
+            self.pipelined = False
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+        def set_pipelined(self, flag):
+            self.pipelined = flag
+
+        def write(self, data):
+            self.data += data
+
+    remote = _Remote()
+    worker = gui_test.SSHCommandWorker("host", "user", "pw", "remote")
+    worker.UPLOAD_CHUNK_BYTES = 4096
+    worker._sftp = types.SimpleNamespace(file=lambda path, mode, bufsize=-1: remote, stat=lambda path: None)
+    progress, uploaded = [], []
+    worker.upload_progress.connect(progress.append)
+    worker.file_uploaded.connect(uploaded.append)
+    worker._handle_upload(str(local), "/videos/clip.mp4")
+    assert bytes(remote.data) == payload
+    assert remote.pipelined
+    assert progress[-1] == 100
+    assert uploaded == ["/videos/clip.mp4"]
+
+
+def test_ssh_worker_skips_compile_check_inputs():
+    """Only a binary newer than every source counts as current; matching files are not re-uploaded."""
+    worker = gui_test.SSHCommandWorker("host", "user", "pw", "remote")
+    attrs = lambda name, mtime: types.SimpleNamespace(filename=name, st_mtime=mtime)
+
+    class _Sftp:
+        entries = [attrs("master_queue.cpp", 100), attrs("HeliCalHelper.h", 90), attrs("Makefile", 80),
+                   attrs("master_queue", 150), attrs("notes.txt", 500)]
+
+        def listdir_attr(self, path):
+            return self.entries
+
+    worker._sftp = _Sftp()
+    assert worker._master_queue_is_current()
+    _Sftp.entries = _Sftp.entries + [attrs("LED.cpp", 200)]
+    assert not worker._master_queue_is_current()
+
+    uploads = []
+    worker._remote_file_matches = lambda local, remote: not remote.endswith("Makefile")
+    worker._handle_upload = lambda local, remote: uploads.append(remote)
+    assert worker._sync_critical_sources() is True
+    assert uploads == ["remote/Makefile"]
+
+
 def test_pipeline_helper_resolve_stl_path_prefers_user_file(tmp_path):
     """The helper should return the provided file when it exists."""
     mesh = tmp_path / "mesh.stl"
@@ -658,6 +1039,38 @@ def test_pipeline_worker_run_success(monkeypatch, tmp_path):
     assert events and events[-1][0] == "done"
 
 
+def test_pipeline_worker_submits_projection_to_executor(monkeypatch, tmp_path):
+    """With an executor injected, voxelization + projection run through a single submit."""
+    recon = np.zeros((2, 2, 2), dtype=float)
+    sino = types.SimpleNamespace(array=np.zeros((2, 2)), proj_geo=None)
+    submitted = []
+
+    class _Executor:
+        def submit(self, fn, *args):
+            submitted.append(args)
+            fut = concurrent.futures.Future()
+            fut.set_result(fn(*args))
+            return fut
+
+    ns = types.SimpleNamespace(
+        resolve_stl_path=lambda stl, demo: "resolved.stl",
+        voxelize_and_project=lambda path, res, n, ray: (recon, sino, "recon"),
+        save_projection_images=lambda out, s, r: (str(Path(out) / "sino.png"), str(Path(out) / "recon.png")),
+        save_angle_montage=lambda *a, **k: None,
+        write_gcode_from_recon_slice=lambda out, r, cfg: str(Path(out) / "toy.gcode"),
+        save_reconstruction_video=lambda out, s: None,
+    )
+    monkeypatch.setattr(gui_test, "pipeline", ns)
+    monkeypatch.setattr(gui_test, "PIPELINE_OK", True)
+    cfg = {"resolution": 2, "num_angles": 3, "ray_type": "parallel"}
+    worker = gui_test.PipelineWorker("mesh.stl", str(tmp_path), cfg, True, executor=_Executor())
+    events = []
+    worker.done.connect(lambda out: events.append("done"))
+    worker.run()
+    assert submitted == [("resolved.stl", 2, 3, "parallel")]
+    assert events == ["done"]
+
+
 def test_pipeline_worker_run_fails_when_pipeline_missing(monkeypatch):
     """If the helpers cannot be imported the worker should emit failed."""
     monkeypatch.setattr(gui_test, "PIPELINE_OK", False)
@@ -668,6 +1081,31 @@ def test_pipeline_worker_run_fails_when_pipeline_missing(monkeypatch):
     assert "not available" in errors[0]
 
 
+def test_pipeline_worker_reports_unusable_output_dir(monkeypatch, tmp_path):
+    """The worker creates the output folder itself and reports failures through failed."""
+    blocker = tmp_path / "not_a_dir"
+    blocker.write_text("", encoding="utf-8")
+    monkeypatch.setattr(gui_test, "PIPELINE_OK", True)
+    worker = gui_test.PipelineWorker("", str(blocker / "out"), {"resolution": 1, "num_angles": 1}, False)
+    errors = []
+    worker.failed.connect(errors.append)
+    worker.run()
+    assert errors and errors[0].startswith("Output dir error")
+
+
+def test_pipeline_worker_start_replaces_run_inputs(monkeypatch, tmp_path):
+    """start() swaps in the next run's inputs so one worker object serves every click."""
+    monkeypatch.setattr(gui_test, "PIPELINE_OK", False)
+    worker = gui_test.PipelineWorker()
+    worker.job_plan_path = "stale.gcode"
+    errors = []
+    worker.failed.connect(errors.append)
+    worker.start("mesh.stl", str(tmp_path), {"resolution": 4}, True)
+    assert (worker.stl, worker.out_dir, worker.cfg, worker.demo_mode) == ("mesh.stl", str(tmp_path), {"resolution": 4}, True)
+    assert worker.job_plan_path == ""
+    assert errors
+
+
 def test_pipeline_worker_run_handles_exceptions(monkeypatch):
     """Helper exceptions should be surfaced via the failed signal."""
     def bad_resolve(*args, **kwargs):
@@ -707,3 +1145,15 @@ def test_save_projection_images_and_montage(tmp_path):
     assert Path(sino_path).exists()
     assert Path(recon_path).exists()
     assert (Path(tmp_path) / "angle_montage.png").exists()
+
+
+def test_save_all_from_sino_writes_every_artifact(monkeypatch, tmp_path):
+    """The fused helper should produce the same preview files plus the video in one call."""
+    sino = types.SimpleNamespace(array=np.random.rand(12, 6, 5), proj_geo=None)
+    recon = np.zeros((4, 4, 4))
+    monkeypatch.setattr(helpers, "save_reconstruction_video", lambda out, s: str(Path(out) / "preview.mp4"))
+    sino_path, recon_path, montage_path, video_path = helpers.save_all_from_sino(str(tmp_path), sino, recon, n_cols=4)
+    assert Path(sino_path).exists()
+    assert Path(recon_path).exists()
+    assert Path(montage_path).name == "angle_montage.png" and Path(montage_path).exists()
+    assert video_path.endswith("preview.mp4")